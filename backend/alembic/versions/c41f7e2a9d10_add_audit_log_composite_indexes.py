@@ -0,0 +1,53 @@
+"""add_audit_log_composite_indexes
+
+Revision ID: c41f7e2a9d10
+Revises: be98e4538f5c
+Create Date: 2026-10-16 10:12:44.318207
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41f7e2a9d10"
+down_revision: Union[str, None] = "be98e4538f5c"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Build the indexes outside the migration transaction so PostgreSQL can use
+    # CREATE INDEX CONCURRENTLY and not lock audit_logs against writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_action_timestamp",
+            "audit_logs",
+            ["action", sa.text("timestamp DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_audit_logs_user_id_timestamp",
+            "audit_logs",
+            ["user_id", sa.text("timestamp DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_audit_logs_user_id_timestamp",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_audit_logs_action_timestamp",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
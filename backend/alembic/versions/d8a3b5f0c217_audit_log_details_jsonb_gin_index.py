@@ -0,0 +1,66 @@
+"""audit_log_details_jsonb_gin_index
+
+Revision ID: d8a3b5f0c217
+Revises: c41f7e2a9d10
+Create Date: 2026-10-16 14:03:27.902114
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d8a3b5f0c217"
+down_revision: Union[str, None] = "c41f7e2a9d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # JSONB and GIN indexes are PostgreSQL features; other databases keep JSON
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.alter_column(
+        "audit_logs",
+        "details",
+        existing_type=postgresql.JSON(astext_type=sa.Text()),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=True,
+        postgresql_using="details::jsonb",
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_audit_logs_details_gin",
+            "audit_logs",
+            ["details"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_audit_logs_details_gin",
+            table_name="audit_logs",
+            postgresql_concurrently=True,
+        )
+
+    op.alter_column(
+        "audit_logs",
+        "details",
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=True,
+        postgresql_using="details::json",
+    )
@@ -10,20 +10,20 @@ from config.settings import settings
 # Set ENVIRONMENT=development in .env to enable query logging
 echo_sql = os.getenv("ENVIRONMENT", "development") == "development"
 
-# Azure-optimized database configuration
-# Use connection pooling for production, NullPool for development
+# Database configuration
+# Pool connections for server databases so requests reuse open connections
+# instead of paying a new connect/auth handshake each time; SQLite files use
+# NullPool to avoid sharing connections across threads.
 engine_kwargs = {
     "pool_pre_ping": True,  # Verify connections before using them
     "pool_recycle": 3600,  # Recycle connections after 1 hour
     "echo": echo_sql,  # Enable SQL query logging in development
 }
 
-# Configure connection pool based on environment
-if (
-    "azure" in settings.database_url.lower()
-    or "postgres.database.azure.com" in settings.database_url
-):
-    # Azure PostgreSQL optimizations
+# Configure connection pool based on database
+if settings.database_url.startswith("sqlite"):
+    engine_kwargs["poolclass"] = NullPool
+else:
     engine_kwargs.update(
         {
             "poolclass": QueuePool,
@@ -32,9 +32,6 @@ if (
             "pool_timeout": 30,  # Timeout for getting a connection from pool
         }
     )
-else:
-    # Local development - use NullPool to avoid connection issues
-    engine_kwargs["poolclass"] = NullPool
 
 engine = create_engine(settings.database_url, **engine_kwargs)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
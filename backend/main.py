@@ -12,7 +12,7 @@ from database import engine
 from middleware.rate_limit import setup_rate_limiting
 from middleware.security_headers import SecurityHeadersMiddleware
 from models.base import Base
-from routers import admin, artworks, auth, bids, health, payments, stats, users
+from routers import admin, artworks, auth, batch, bids, health, payments, stats, users
 from services.auth_service import AuthService
 from services.jwt_service import JWTService
 
@@ -64,6 +64,7 @@ app.include_router(bids.router, prefix="/api/bids", tags=["bids"])
 app.include_router(payments.router, prefix="/api/payments", tags=["payments"])
 app.include_router(stats.router, prefix="/api/stats", tags=["stats"])
 app.include_router(admin.router)
+app.include_router(batch.router, prefix="/api/batch", tags=["batch"])
 
 # Mount static files for image uploads
 # Create uploads directory if it doesn't exist
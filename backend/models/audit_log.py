@@ -4,7 +4,8 @@ Audit log model for tracking security-critical actions.
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 from models.base import Base
@@ -20,7 +21,8 @@ class AuditLog(Base):
     action = Column(String, nullable=False, index=True)
     resource_type = Column(String, nullable=False)  # 'bid', 'artwork', 'user'
     resource_id = Column(Integer, nullable=True)
-    details = Column(JSON, nullable=True)
+    # JSONB on PostgreSQL so details can be searched through a GIN index
+    details = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
     ip_address = Column(String, nullable=True)
     user_agent = Column(String, nullable=True)
     timestamp = Column(DateTime, default=datetime.utcnow, index=True)
@@ -30,3 +32,12 @@ class AuditLog(Base):
 
     def __repr__(self):
         return f"<AuditLog {self.action} by user {self.user_id}>"
+
+
+# Composite indexes for "latest entries for an action / user" lookups
+Index("ix_audit_logs_action_timestamp", AuditLog.action, AuditLog.timestamp.desc())
+Index("ix_audit_logs_user_id_timestamp", AuditLog.user_id, AuditLog.timestamp.desc())
+# Containment lookups on details (e.g. details @> '{"artwork_id": 5}'), PostgreSQL only
+Index("ix_audit_logs_details_gin", AuditLog.details, postgresql_using="gin").ddl_if(
+    dialect="postgresql"
+)
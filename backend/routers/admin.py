@@ -17,6 +17,7 @@ from models.bid import Bid
 from models.user import User
 from services.audit_service import AuditService
 from utils.auth import get_current_user
+from utils.cache import admin_cache
 
 router = APIRouter(prefix="/api/admin", tags=["admin"])
 
@@ -195,7 +196,11 @@ async def get_platform_overview(
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Get comprehensive platform statistics."""
+    """Get comprehensive platform statistics (cached for a few seconds)."""
+    return admin_cache.get_or_set("stats_overview", lambda: _platform_overview(db))
+
+
+def _platform_overview(db: Session) -> dict:
     # User stats
     total_users = db.query(User).count()
     users_last_30_days = (
@@ -275,7 +280,15 @@ async def get_system_health(
     except Exception as e:
         db_status = f"unhealthy: {str(e)}"
 
-    # Get recent activity
+    return {
+        "status": "healthy" if db_status == "healthy" else "degraded",
+        "database": db_status,
+        "metrics": admin_cache.get_or_set("health_metrics", lambda: _recent_activity(db)),
+        "timestamp": datetime.now(UTC).isoformat(),
+    }
+
+
+def _recent_activity(db: Session) -> dict:
     recent_bids = (
         db.query(Bid).filter(Bid.created_at >= datetime.now(UTC) - timedelta(hours=1)).count()
     )
@@ -287,13 +300,8 @@ async def get_system_health(
     )
 
     return {
-        "status": "healthy" if db_status == "healthy" else "degraded",
-        "database": db_status,
-        "metrics": {
-            "bids_last_hour": recent_bids,
-            "artworks_last_24h": recent_artworks,
-        },
-        "timestamp": datetime.now(UTC).isoformat(),
+        "bids_last_hour": recent_bids,
+        "artworks_last_24h": recent_artworks,
     }
 
 
@@ -311,7 +319,14 @@ async def get_audit_logs(
     current_user: User = Depends(require_admin),
     db: Session = Depends(get_db),
 ):
-    """Get audit logs for security monitoring."""
+    """Get audit logs for security monitoring (cached until the next audit event)."""
+    key = ("audit_logs", skip, limit, action, user_id)
+    return admin_cache.get_or_set(key, lambda: _audit_log_page(db, skip, limit, action, user_id))
+
+
+def _audit_log_page(
+    db: Session, skip: int, limit: int, action: Optional[str], user_id: Optional[int]
+) -> dict:
     query = db.query(AuditLog).options(joinedload(AuditLog.user))
 
     if action:
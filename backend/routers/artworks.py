@@ -1,33 +1,80 @@
 import os
 import uuid
 from datetime import UTC, datetime
-from typing import List
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile
 from PIL import Image
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session, joinedload
 
 from database import get_db
 from middleware.rate_limit import limiter
 from models import Artwork
+from models.artwork import ArtworkStatus
 from models.user import User
 from schemas import ArtworkCreate, ArtworkResponse, ArtworkUpdate
 from services.auction_service import AuctionService
 from utils.auth import get_current_user, require_admin, require_seller
+from utils.cache import clear_admin_cache_on_commit
 
 router = APIRouter()
 
+# Columns returned by the public list endpoint (matches ArtworkResponse)
+ARTWORK_LIST_COLUMNS = (
+    Artwork.id,
+    Artwork.seller_id,
+    Artwork.title,
+    Artwork.description,
+    Artwork.artist_name,
+    Artwork.category,
+    Artwork.current_highest_bid,
+    Artwork.image_url,
+    Artwork.status,
+    Artwork.end_date,
+    Artwork.created_at,
+)
+
+# List statements are built once at import; pagination and the filters are
+# bound parameters so the compiled SQL is reused across requests. They are
+# keyed on (filter by status, seek past after_id).
+_LIST_STMT = (
+    select(*ARTWORK_LIST_COLUMNS)
+    .order_by(Artwork.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+_BY_STATUS = Artwork.status == bindparam("status")
+_AFTER_ID = Artwork.id > bindparam("after_id")
+_LIST_STMTS = {
+    (False, False): _LIST_STMT,
+    (True, False): _LIST_STMT.where(_BY_STATUS),
+    (False, True): _LIST_STMT.where(_AFTER_ID),
+    (True, True): _LIST_STMT.where(_BY_STATUS, _AFTER_ID),
+}
+
 
 @router.get("/", response_model=List[ArtworkResponse])
-async def get_artworks(skip: int = 0, limit: int = 20, db: Session = Depends(get_db)):
+async def get_artworks(
+    skip: int = 0,
+    limit: int = 20,
+    status: Optional[ArtworkStatus] = None,
+    after_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+):
     """
     Get list of artworks with pagination.
 
     Query parameters:
     - skip: Number of records to skip (default: 0)
     - limit: Maximum number of records to return (default: 20, max: 100)
+    - status: Only return artworks with this status (optional)
+    - after_id: Only return artworks with an id greater than this (optional).
+      Pass the last id of the previous page to page through results by key
+      instead of by offset, which stays fast on deep pages.
 
-    Performance: Uses eager loading to prevent N+1 queries.
+    Performance: Selects only the columns exposed by ArtworkResponse as plain
+    rows, skipping ORM object hydration and the seller relationship.
     """
     # Validate pagination parameters
     if skip < 0:
@@ -40,9 +87,14 @@ async def get_artworks(skip: int = 0, limit: int = 20, db: Session = Depends(get
     if limit > 100:
         raise HTTPException(status_code=400, detail="Limit cannot exceed 100")
 
-    # Eager load seller relationship to prevent N+1 queries
-    artworks = db.query(Artwork).options(joinedload(Artwork.seller)).offset(skip).limit(limit).all()
-    return artworks
+    params = {"skip": skip, "limit": limit}
+    if status is not None:
+        params["status"] = status
+    if after_id is not None:
+        params["after_id"] = after_id
+    stmt = _LIST_STMTS[(status is not None, after_id is not None)]
+    rows = db.execute(stmt, params).mappings()
+    return [dict(row) for row in rows]
 
 
 @router.get("/{artwork_id}", response_model=ArtworkResponse)
@@ -89,6 +141,8 @@ async def create_artwork(
     # Create artwork with authenticated user's ID
     db_artwork = Artwork(**artwork.dict(), seller_id=current_user.id)
     db.add(db_artwork)
+    # Admin overview counts artworks; refresh it once this is committed
+    clear_admin_cache_on_commit(db)
     db.commit()
     db.refresh(db_artwork)
     return db_artwork
@@ -167,6 +221,7 @@ async def update_artwork(
     for field, value in update_data.items():
         setattr(artwork, field, value)
 
+    clear_admin_cache_on_commit(db)
     db.commit()
     db.refresh(artwork)
     return artwork
@@ -197,6 +252,7 @@ async def delete_artwork(
         raise HTTPException(status_code=400, detail="Cannot delete sold artwork")
 
     db.delete(artwork)
+    clear_admin_cache_on_commit(db)
     db.commit()
     return {"message": "Artwork deleted successfully"}
 
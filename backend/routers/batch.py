@@ -0,0 +1,74 @@
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import JSONResponse
+from httpx import URL, ASGITransport, AsyncClient
+
+from middleware.rate_limit import limiter
+from schemas.batch import BatchRequest, BatchResponse, SubResponse
+
+router = APIRouter()
+
+BASE_URL = URL("http://batch")
+
+
+def _resolve_sub_path(path: str) -> URL:
+    """Resolve a sub-request path the way the client will dispatch it.
+
+    httpx removes dot segments when joining against the base URL, so the
+    allowlist must be checked on the resolved path, not the raw string.
+    """
+    url = BASE_URL.join(path)
+    segments = url.path.split("/")
+    if (
+        url.host != BASE_URL.host
+        or "." in segments
+        or ".." in segments  # Percent-encoded dot segments survive the join
+        or not url.path.startswith("/api/")
+        or url.path.startswith("/api/batch")
+    ):
+        raise HTTPException(status_code=400, detail=f"Path not allowed in batch: {path}")
+    return url
+
+
+@router.post("/", response_model=BatchResponse)
+@limiter.limit("10/minute")  # Each batch can fan out into MAX_BATCH_SIZE calls
+async def run_batch(batch: BatchRequest, request: Request):
+    """
+    Execute several API calls in one round trip.
+
+    Sub-requests run sequentially and in order, so later calls can depend on
+    earlier ones. They are dispatched in-process through the ASGI app with the
+    caller's Authorization header and client address, so each one goes through
+    the same authentication, per-client rate limiting and validation as a
+    direct call.
+    Returns 200 if every sub-request succeeded, otherwise 207 (multi-status).
+    """
+    urls = [_resolve_sub_path(sub.path) for sub in batch.requests]
+
+    headers = {}
+    if "authorization" in request.headers:
+        headers["Authorization"] = request.headers["authorization"]
+
+    responses = []
+    transport_kwargs = {}
+    if request.client:
+        # Sub-requests count against the caller's own rate-limit bucket
+        transport_kwargs["client"] = (request.client.host, request.client.port)
+    # An unhandled error in one sub-request becomes its own 500, not the batch's
+    transport = ASGITransport(app=request.app, raise_app_exceptions=False, **transport_kwargs)
+    async with AsyncClient(transport=transport, base_url=BASE_URL) as client:
+        for sub, url in zip(batch.requests, urls):
+            kwargs = {"params": sub.params, "headers": headers}
+            if sub.json_body is not None:
+                kwargs["json"] = sub.json_body
+            result = await client.request(sub.method, url, **kwargs)
+            try:
+                body = result.json()
+            except ValueError:
+                body = result.text or None
+            responses.append(SubResponse(status=result.status_code, body=body))
+
+    status_code = 200 if all(r.status < 400 for r in responses) else 207
+    return JSONResponse(
+        status_code=status_code,
+        content=BatchResponse(responses=responses).model_dump(),
+    )
@@ -7,7 +7,7 @@ from database import get_db
 from middleware.rate_limit import limiter
 from models import Artwork, Bid
 from models.user import User
-from schemas import BidCreate, BidResponse
+from schemas import BidCreate, BidPlacedResponse, BidResponse
 from services.audit_service import AuditService
 from utils.auth import get_current_user
 
@@ -39,7 +39,7 @@ async def get_artwork_bids(artwork_id: int, db: Session = Depends(get_db)):
     return bids
 
 
-@router.post("/", response_model=BidResponse)
+@router.post("/", response_model=BidPlacedResponse)
 @limiter.limit("20/minute")  # Max 20 bids per minute per user
 async def create_bid(
     request: Request,
@@ -113,10 +113,10 @@ async def create_bid(
         artwork.status = "PENDING_PAYMENT"
 
     db.add(db_bid)
-    db.commit()
-    db.refresh(db_bid)
+    db.flush()
 
-    # Add audit log for bid placement
+    # Add audit log for bid placement in the same transaction as the bid,
+    # so placing a bid costs a single commit
     AuditService.log_action(
         db=db,
         action="bid_placed",
@@ -129,7 +129,10 @@ async def create_bid(
             "is_winning": db_bid.is_winning,
         },
         request=request,
+        commit=False,
     )
+    db.commit()
+    db.refresh(db_bid)
 
     # Emit socket event for real-time bidding
     # Wrapped in try-except to ensure HTTP response is sent even if socket fails
@@ -192,7 +195,11 @@ async def create_bid(
 
         traceback.print_exc()
 
-    return db_bid
+    return BidPlacedResponse(
+        **BidResponse.model_validate(db_bid).model_dump(),
+        artwork_status=artwork.status,
+        current_highest_bid=float(artwork.current_highest_bid or 0.0),
+    )
 
 
 @router.get("/my-bids", response_model=List[BidResponse])
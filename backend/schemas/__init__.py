@@ -1,6 +1,7 @@
 from .artwork import ArtworkBase, ArtworkCreate, ArtworkResponse, ArtworkUpdate
 from .auth import AuthUser, TokenResponse
-from .bid import BidBase, BidCreate, BidResponse
+from .batch import BatchRequest, BatchResponse, SubRequest, SubResponse
+from .bid import BidBase, BidCreate, BidPlacedResponse, BidResponse
 from .payment import PaymentCreate, PaymentIntentResponse, PaymentResponse
 from .user import UserBase, UserCreate, UserResponse, UserUpdate
 
@@ -13,9 +14,14 @@ __all__ = [
     "ArtworkCreate",
     "ArtworkResponse",
     "ArtworkUpdate",
+    "BatchRequest",
+    "BatchResponse",
+    "SubRequest",
+    "SubResponse",
     "BidBase",
     "BidCreate",
     "BidResponse",
+    "BidPlacedResponse",
     "PaymentCreate",
     "PaymentIntentResponse",
     "PaymentResponse",
@@ -0,0 +1,35 @@
+"""Schemas for batching several API calls into one request."""
+
+from typing import Any, Dict, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+MAX_BATCH_SIZE = 20
+
+
+class SubRequest(BaseModel):
+    """A single API call inside a batch."""
+
+    method: Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+    path: str = Field(..., description="API path, e.g. /api/admin/audit-logs")
+    params: Optional[Dict[str, Any]] = None
+    json_body: Optional[Any] = Field(default=None, alias="json")
+
+
+class BatchRequest(BaseModel):
+    """Ordered list of API calls executed sequentially."""
+
+    requests: List[SubRequest] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class SubResponse(BaseModel):
+    """Result of a single API call inside a batch."""
+
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    """Results in the same order as the submitted requests."""
+
+    responses: List[SubResponse]
@@ -2,6 +2,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict
 
+from models.artwork import ArtworkStatus
+
 
 class BidBase(BaseModel):
     amount: float
@@ -19,3 +21,17 @@ class BidResponse(BidBase):
     is_winning: bool
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class BidPlacedResponse(BidResponse):
+    """
+    Response for a newly placed bid.
+
+    Includes the artwork state after the bid so clients don't need a
+    follow-up GET to learn whether the artwork moved to PENDING_PAYMENT.
+    """
+
+    artwork_status: ArtworkStatus
+    current_highest_bid: float
+
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
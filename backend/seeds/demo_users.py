@@ -55,24 +55,26 @@ def seed_users(db: Session) -> int:
         {"auth0_sub": "auth0|6926e931ec0b07c94d935a66"},  # BuyerElla
     ]
 
-    created_count = 0
+    # Check which users already exist in one query (idempotency)
+    demo_subs = [user_data["auth0_sub"] for user_data in demo_users]
+    existing_subs = {
+        sub for (sub,) in db.query(User.auth0_sub).filter(User.auth0_sub.in_(demo_subs))
+    }
 
+    new_users = []
     for user_data in demo_users:
-        # Check if user already exists (idempotency)
-        existing_user = db.query(User).filter(User.auth0_sub == user_data["auth0_sub"]).first()
-
-        if not existing_user:
-            # Create new user reference
-            new_user = User(**user_data)
-            db.add(new_user)
+        if user_data["auth0_sub"] not in existing_subs:
+            new_users.append(user_data)
             print(f"   ✓ Created user reference: {user_data['auth0_sub']}")
         else:
             print(f"   ↻ User reference already exists: {user_data['auth0_sub']}")
 
-        created_count += 1
+    # Insert all new user references in a single batch
+    if new_users:
+        db.bulk_insert_mappings(User, new_users)
 
     db.commit()
-    return created_count
+    return len(demo_users)
 
 
 if __name__ == "__main__":
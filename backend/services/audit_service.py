@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from models.audit_log import AuditLog
 from models.user import User
+from utils.cache import clear_admin_cache_on_commit
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,7 @@ class AuditService:
         user: Optional[User] = None,
         details: Optional[Dict[str, Any]] = None,
         request: Optional[Request] = None,
+        commit: bool = True,
     ) -> AuditLog:
         """
         Log a security-critical action.
@@ -37,6 +39,9 @@ class AuditService:
             user: User who performed the action
             details: Additional details (JSON)
             request: FastAPI request object for IP/user-agent
+            commit: Commit the entry on its own. Pass False to write it in a
+                SAVEPOINT inside the caller's open transaction, so the caller's
+                commit persists it together with the audited change.
 
         Returns:
             AuditLog: The created audit log entry, or None if logging failed
@@ -52,9 +57,18 @@ class AuditService:
                 user_agent=request.headers.get("user-agent") if request else None,
             )
 
-            db.add(audit_log)
-            db.commit()
-            db.refresh(audit_log)
+            # Admin dashboards cache audit logs and stats; drop them once this
+            # event is committed, whether here or by the caller
+            clear_admin_cache_on_commit(db)
+
+            if commit:
+                db.add(audit_log)
+                db.commit()
+                db.refresh(audit_log)
+            else:
+                # A failed insert only rolls back the SAVEPOINT, not the caller's work
+                with db.begin_nested():
+                    db.add(audit_log)
 
             logger.info(
                 f"Audit log created: {action} on {resource_type}:{resource_id} "
@@ -65,6 +79,7 @@ class AuditService:
 
         except Exception as e:
             logger.error(f"Failed to create audit log: {str(e)}")
-            db.rollback()
+            if commit:
+                db.rollback()
             # Don't fail the main operation if audit logging fails
             return None
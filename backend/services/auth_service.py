@@ -1,17 +1,54 @@
+import time
 from typing import Optional
 
 import requests
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from config.settings import settings
 from models.user import User
 from schemas.auth import AuthUser
 
+# After a connection failure, skip Auth0 for this many seconds and go straight to JWT
+AUTH0_OUTAGE_SECONDS = 30
+_auth0_retry_after = 0.0
+
+# Dialect-specific INSERT constructs that support ON CONFLICT DO NOTHING
+_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+def _insert_user_if_missing(db: Session, auth0_sub: str) -> None:
+    """Insert a user row for ``auth0_sub`` unless one already exists.
+
+    Concurrent first logins for the same Auth0 subject both miss the lookup;
+    the unique constraint decides the winner and the loser's insert is a no-op.
+    Dialects without ON CONFLICT fall back to an ORM insert in a SAVEPOINT.
+    """
+    insert = _INSERTS.get(db.get_bind().dialect.name)
+    if insert is None:
+        try:
+            with db.begin_nested():
+                db.add(User(auth0_sub=auth0_sub))
+        except IntegrityError:
+            pass  # Another request created the user first
+        return
+
+    db.execute(
+        insert(User)
+        .values(auth0_sub=auth0_sub)
+        .on_conflict_do_nothing(index_elements=[User.auth0_sub])
+    )
+
 
 class AuthService:
     @staticmethod
     def verify_auth0_token(token: str) -> Optional[AuthUser]:
         """Verify Auth0 token and return user info with roles"""
+        global _auth0_retry_after
+        if time.monotonic() < _auth0_retry_after:
+            raise ValueError("Auth0 verification skipped: Auth0 recently unreachable")
         try:
             userinfo_url = f"https://{settings.auth0_domain}/userinfo"
             headers = {"Authorization": f"Bearer {token}"}
@@ -39,6 +76,8 @@ class AuthService:
                 raise ValueError(f"Invalid Auth0 token: {response.status_code} - {response.text}")
         except requests.RequestException as e:
             print(f"[AUTH0 DEBUG] Request exception: {str(e)}")
+            if isinstance(e, (requests.ConnectionError, requests.Timeout)):
+                _auth0_retry_after = time.monotonic() + AUTH0_OUTAGE_SECONDS
             raise ValueError(f"Auth0 verification failed: {str(e)}")
 
     @staticmethod
@@ -52,10 +91,9 @@ class AuthService:
 
         if not user:
             # Create minimal user record
-            user = User(auth0_sub=auth_user.sub)
-            db.add(user)
+            _insert_user_if_missing(db, auth_user.sub)
             db.commit()
-            db.refresh(user)
+            user = db.query(User).filter(User.auth0_sub == auth_user.sub).one()
 
         # Attach Auth0 data to user object (not stored in DB)
         user.email = auth_user.email or ""
@@ -4,12 +4,14 @@ Provides database, client, and authentication mocks.
 """
 
 from datetime import timedelta
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from unittest.mock import patch
 
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, event
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -20,9 +22,14 @@ from models.base import Base
 from models.bid import Bid
 from models.user import User
 from schemas.auth import AuthUser
+from services import auth_service
+from services.auth_service import AuthService
 from services.jwt_service import JWTService
+from utils.cache import admin_cache
 
-# Test database setup with SQLite in-memory
+# Test database setup with SQLite in-memory.
+# Each pytest-xdist worker is a separate process, so every worker gets its own
+# private in-memory database and tests can run in parallel (pytest -n auto).
 SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///:memory:"
 
 engine = create_engine(
@@ -39,9 +46,21 @@ def set_sqlite_pragma(dbapi_conn, connection_record):
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.close()
+    # Disable pysqlite's own transaction handling so SAVEPOINTs work and
+    # SQLAlchemy controls BEGIN (see set_sqlite_begin below)
+    dbapi_conn.isolation_level = None
 
 
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+@event.listens_for(engine, "begin")
+def set_sqlite_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+
+# Sessions join the per-test outer transaction through a SAVEPOINT, so
+# commit()/rollback() calls made by tests and routes never escape it.
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, join_transaction_mode="create_savepoint"
+)
 
 
 @pytest.fixture(autouse=True)
@@ -58,35 +77,34 @@ def reset_rate_limiter():
     yield
 
 
-@pytest.fixture(scope="function")
-def db_session() -> Generator:
-    """
-    Create a fresh database session for each test.
-    Database is created and torn down for each test function.
-    """
-    Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
-    try:
-        yield session
-    finally:
-        session.close()
-        Base.metadata.drop_all(bind=engine)
+@pytest.fixture(autouse=True)
+def reset_admin_cache():
+    """Clear cached admin aggregates between tests."""
+    admin_cache.clear()
+    yield
 
 
-@pytest.fixture(scope="function")
-def client(db_session) -> TestClient:
-    """
-    Create a test client with overridden database dependency.
-    """
+@pytest.fixture(autouse=True)
+def reset_auth0_outage():
+    """Forget any Auth0 outage recorded by a previous test."""
+    auth_service._auth0_retry_after = 0.0
+    yield
 
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
 
-    app.dependency_overrides[get_db] = override_get_db
+@pytest.fixture(scope="session")
+def setup_database() -> Generator:
+    """Create the schema once for the whole test session."""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
 
+@pytest.fixture(scope="session")
+def test_client(setup_database) -> Generator:
+    """
+    Start the app once for the whole test session.
+    Use the function-scoped ``client`` fixture in tests.
+    """
     # Override the database engine used in startup event
     import database
 
@@ -106,9 +124,51 @@ def client(db_session) -> TestClient:
         # Restore original engines
         database.engine = original_engine
         main.engine = original_main_engine
+
+
+@pytest.fixture(scope="function")
+def db_session(setup_database) -> Generator:
+    """
+    Create a database session for each test.
+    Each test runs inside a transaction that is rolled back afterwards.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = TestingSessionLocal(bind=connection)
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="function")
+def client(test_client, db_session) -> TestClient:
+    """
+    Provide the shared test client with the database dependency overridden.
+    The app instance from main is reused; only the get_db override changes.
+    """
+    app.dependency_overrides[get_db] = lambda: db_session
+    test_client.cookies.clear()
+    try:
+        yield test_client
+    finally:
         app.dependency_overrides.clear()
 
 
+@pytest_asyncio.fixture
+async def aclient(client) -> AsyncGenerator:
+    """
+    Async HTTP client for the app, for tests that interleave several requests
+    with asyncio.gather. Shares the database override set up by ``client``, so
+    every request uses the same db_session and their synchronous route bodies
+    run one after another; this exercises async dispatch, not database races.
+    """
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
 # User fixtures
 @pytest.fixture
 def buyer_user(db_session) -> User:
@@ -169,6 +229,19 @@ def artwork(db_session, seller_user) -> Artwork:
     return artwork
 
 
+@pytest.fixture
+def make_artworks(db_session, seller_user):
+    """
+    Factory that inserts active artworks owned by the test seller.
+    Rows are titled "Art 1".."Art N".
+    """
+
+    def _make_artworks(count: int) -> None:
+        bulk_seed_artworks(db_session, seller_user.id, count)
+
+    return _make_artworks
+
+
 @pytest.fixture
 def sold_artwork(db_session, seller_user) -> Artwork:
     """Create a sold artwork for testing edge cases."""
@@ -197,72 +270,93 @@ def bid(db_session, artwork, buyer_user) -> Bid:
 
 
 # JWT and Auth0 mocking fixtures
+@pytest.fixture(scope="session")
+def token_factory():
+    """
+    Mint JWT tokens, caching them for the whole test session.
+    Tokens are deterministic for a given set of claims, so each is signed once.
+    """
+    cache = {}
+
+    def _create_token(sub: str, role: str = "BUYER", email: str = None, name: str = None) -> str:
+        key = (sub, role, email, name)
+        if key not in cache:
+            data = {"sub": sub, "role": role}
+            if email is not None:
+                data["email"] = email
+            if name is not None:
+                data["name"] = name
+            cache[key] = JWTService.create_access_token(data=data, expires_delta=timedelta(hours=1))
+        return cache[key]
+
+    return _create_token
+
+
 @pytest.fixture
-def buyer_token(buyer_user) -> str:
-    """Generate a valid JWT token for buyer user."""
-    return JWTService.create_access_token(
-        data={
-            "sub": buyer_user.auth0_sub,
-            "email": buyer_user.email,
-            "name": buyer_user.name,
-            "role": "BUYER",
-        },
-        expires_delta=timedelta(hours=1),
+def buyer_token(buyer_user, token_factory) -> str:
+    """Valid JWT token for buyer user."""
+    return token_factory(
+        buyer_user.auth0_sub, role="BUYER", email=buyer_user.email, name=buyer_user.name
     )
 
 
 @pytest.fixture
-def seller_token(seller_user) -> str:
-    """Generate a valid JWT token for seller user."""
-    return JWTService.create_access_token(
-        data={
-            "sub": seller_user.auth0_sub,
-            "email": seller_user.email,
-            "name": seller_user.name,
-            "role": "SELLER",
-        },
-        expires_delta=timedelta(hours=1),
+def seller_token(seller_user, token_factory) -> str:
+    """Valid JWT token for seller user."""
+    return token_factory(
+        seller_user.auth0_sub, role="SELLER", email=seller_user.email, name=seller_user.name
     )
 
 
 @pytest.fixture
-def admin_token(admin_user) -> str:
-    """Generate a valid JWT token for admin user."""
-    return JWTService.create_access_token(
-        data={
-            "sub": admin_user.auth0_sub,
-            "email": admin_user.email,
-            "name": admin_user.name,
-            "role": "ADMIN",
-        },
-        expires_delta=timedelta(hours=1),
+def admin_token(admin_user, token_factory) -> str:
+    """Valid JWT token for admin user."""
+    return token_factory(
+        admin_user.auth0_sub, role="ADMIN", email=admin_user.email, name=admin_user.name
     )
 
 
-@pytest.fixture
+def _auth0_unavailable(token: str):
+    raise Exception("Auth0 not available - using JWT")
+
+
+@pytest.fixture(scope="module")
+def auth0_unavailable():
+    """
+    Make Auth0 verification fail for a whole module so requests use the JWT
+    fallback. Opt in with ``pytestmark = pytest.mark.usefixtures("auth0_unavailable")``;
+    the stub is installed once per module rather than patched per test.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(AuthService, "verify_auth0_token", staticmethod(_auth0_unavailable))
+        yield
+
+
+def _create_auth0_user(
+    sub: str = "auth0|test123",
+    email: str = "test@example.com",
+    name: str = "Test User",
+    roles: list[str] = None,
+) -> AuthUser:
+    if roles is None:
+        roles = ["buyer"]
+    return AuthUser(
+        sub=sub,
+        email=email,
+        name=name,
+        picture="https://example.com/avatar.jpg",
+        email_verified=True,
+        roles=roles,
+    )
+
+
+@pytest.fixture(scope="session")
 def mock_auth0_response():
     """
     Mock Auth0 /userinfo endpoint response.
     Returns a factory function to create different Auth0 users.
+    Each call builds a fresh AuthUser, so tests may mutate the result.
     """
-
-    def _create_auth0_user(
-        sub: str = "auth0|test123",
-        email: str = "test@example.com",
-        name: str = "Test User",
-        roles: list[str] = None,
-    ) -> AuthUser:
-        if roles is None:
-            roles = ["buyer"]
-        return AuthUser(
-            sub=sub,
-            email=email,
-            name=name,
-            picture="https://example.com/avatar.jpg",
-            email_verified=True,
-            roles=roles,
-        )
-
     return _create_auth0_user
 
 
@@ -278,6 +372,33 @@ def mock_auth0_service(mock_auth0_response):
 
 
 # Helper functions for tests
+_SEED_COLUMNS = "seller_id, title, secret_threshold, current_highest_bid, status"
+_SEED_VALUES = ":seller_id, 'Art ' || n, 100.0, 0.0, 'ACTIVE'"
+# Built once at import so the seeding statement is reused by every test
+_SEED_ARTWORKS_STMTS = {
+    "postgresql": text(
+        f"INSERT INTO artworks ({_SEED_COLUMNS}) "
+        f"SELECT {_SEED_VALUES} FROM generate_series(1, :count) AS n"
+    ),
+    "sqlite": text(
+        "WITH RECURSIVE series(n) AS "
+        "(SELECT 1 UNION ALL SELECT n + 1 FROM series WHERE n < :count) "
+        f"INSERT INTO artworks ({_SEED_COLUMNS}) SELECT {_SEED_VALUES} FROM series"
+    ),
+}
+
+
+def bulk_seed_artworks(db_session, seller_id: int, count: int) -> None:
+    """
+    Insert ``count`` active artworks with a single INSERT ... SELECT.
+    Rows are generated in the database (generate_series on PostgreSQL, a
+    recursive CTE on SQLite), so no ORM objects are built.
+    """
+    statement = _SEED_ARTWORKS_STMTS[db_session.bind.dialect.name]
+    db_session.execute(statement, {"seller_id": seller_id, "count": count})
+    db_session.commit()
+
+
 def create_auth_header(token: str) -> dict:
     """Helper to create Authorization header."""
     return {"Authorization": f"Bearer {token}"}
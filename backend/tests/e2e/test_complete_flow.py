@@ -3,18 +3,33 @@ End-to-end tests for complete user flows.
 Tests full workflows from registration through bidding to purchase.
 """
 
+import asyncio
+from collections import Counter
 from datetime import timedelta
-from unittest.mock import patch
 
 import pytest
 
+from models.user import User
+from services.jwt_service import JWTService
 
-@pytest.fixture(autouse=True)
-def mock_auth0():
-    """Mock Auth0 verification for all tests in this module to use JWT fallback."""
-    with patch("services.auth_service.AuthService.verify_auth0_token") as mock:
-        mock.side_effect = Exception("Auth0 not available - using JWT")
-        yield mock
+SELLER = "SELLER"
+BUYER = "BUYER"
+
+
+pytestmark = pytest.mark.usefixtures("auth0_unavailable")
+
+
+def create_user_with_token(db_session, auth0_sub: str, role: str) -> tuple[User, str]:
+    """Create a user in the database and mint a JWT for it."""
+    user = User(auth0_sub=auth0_sub)
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    token = JWTService.create_access_token(
+        data={"sub": auth0_sub, "role": role},
+        expires_delta=timedelta(hours=1),
+    )
+    return user, token
 
 
 class TestCompleteUserFlow:
@@ -30,32 +45,11 @@ class TestCompleteUserFlow:
         5. Buyer places winning bid
         6. Artwork is sold
         """
-        from models.user import User
-        from services.jwt_service import JWTService
-
         # Step 1: Create buyer in database
-        buyer = User(auth0_sub="auth0|e2e_buyer")
-        db_session.add(buyer)
-        db_session.commit()
-        db_session.refresh(buyer)
-
-        # Create buyer token
-        buyer_token = JWTService.create_access_token(
-            data={"sub": "auth0|e2e_buyer", "role": "BUYER"},
-            expires_delta=timedelta(hours=1),
-        )
+        buyer, buyer_token = create_user_with_token(db_session, "auth0|e2e_buyer", BUYER)
 
         # Step 2: Create seller in database
-        seller = User(auth0_sub="auth0|e2e_seller")
-        db_session.add(seller)
-        db_session.commit()
-        db_session.refresh(seller)
-
-        # Create seller token
-        seller_token = JWTService.create_access_token(
-            data={"sub": "auth0|e2e_seller", "role": "SELLER"},
-            expires_delta=timedelta(hours=1),
-        )
+        seller, seller_token = create_user_with_token(db_session, "auth0|e2e_seller", SELLER)
 
         # Step 3: Seller creates artwork
         artwork_payload = {
@@ -90,8 +84,7 @@ class TestCompleteUserFlow:
         assert losing_bid_data["amount"] == 300.0
 
         # Verify artwork still active
-        artwork_check = client.get(f"/api/artworks/{artwork_id}")
-        assert artwork_check.json()["status"] == "ACTIVE"
+        assert losing_bid_data["artwork_status"] == "ACTIVE"
 
         # Step 5: Buyer places winning bid
         winning_bid_payload = {
@@ -109,11 +102,8 @@ class TestCompleteUserFlow:
         assert winning_bid_data["amount"] == 500.0
 
         # Step 6: Verify artwork is pending payment
-        final_artwork = client.get(f"/api/artworks/{artwork_id}")
-        assert final_artwork.status_code == 200
-        final_artwork_data = final_artwork.json()
-        assert final_artwork_data["status"] == "PENDING_PAYMENT"
-        assert final_artwork_data["current_highest_bid"] == 500.0
+        assert winning_bid_data["artwork_status"] == "PENDING_PAYMENT"
+        assert winning_bid_data["current_highest_bid"] == 500.0
 
         # Verify all bids are recorded
         bids_response = client.get(f"/api/bids/artwork/{artwork_id}")
@@ -125,32 +115,25 @@ class TestCompleteUserFlow:
 class TestMultipleUsersCompetingFlow:
     """Test flow with multiple buyers competing for artwork."""
 
-    def test_multiple_buyers_bidding_competition(self, client, db_session):
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_multiple_buyers_bidding_competition(self, client, aclient, db_session):
         """
         Flow:
         1. Seller creates artwork
         2. Multiple buyers register
         3. Buyers compete with bids
         4. Highest bidder wins
-        """
-        from models.user import User
-        from services.jwt_service import JWTService
 
+        Bids are placed sequentially since outbid semantics depend on order;
+        the independent post-sale checks are dispatched concurrently.
+        """
         # Step 1: Create seller in database
-        seller = User(auth0_sub="auth0|compete_seller")
-        db_session.add(seller)
-        db_session.commit()
-        db_session.refresh(seller)
-
-        # Create seller token
-        seller_token = JWTService.create_access_token(
-            data={"sub": "auth0|compete_seller", "role": "SELLER"},
-            expires_delta=timedelta(hours=1),
-        )
+        seller, seller_token = create_user_with_token(db_session, "auth0|compete_seller", SELLER)
 
         # Create artwork
         artwork_payload = {"title": "Competitive Art", "secret_threshold": 1000.0}
-        artwork_response = client.post(
+        artwork_response = await aclient.post(
             "/api/artworks/",
             json=artwork_payload,
             headers={"Authorization": f"Bearer {seller_token}"},
@@ -161,17 +144,8 @@ class TestMultipleUsersCompetingFlow:
         buyers = []
         buyer_tokens = []
         for i in range(1, 4):
-            buyer = User(auth0_sub=f"auth0|compete_buyer{i}")
-            db_session.add(buyer)
-            db_session.commit()
-            db_session.refresh(buyer)
+            buyer, token = create_user_with_token(db_session, f"auth0|compete_buyer{i}", BUYER)
             buyers.append(buyer.id)
-
-            # Create buyer token
-            token = JWTService.create_access_token(
-                data={"sub": f"auth0|compete_buyer{i}", "role": "BUYER"},
-                expires_delta=timedelta(hours=1),
-            )
             buyer_tokens.append(token)
 
         # Step 3: Buyers place increasing bids
@@ -183,7 +157,7 @@ class TestMultipleUsersCompetingFlow:
         ]
 
         for buyer_index, amount in bid_amounts:
-            bid_response = client.post(
+            bid_response = await aclient.post(
                 "/api/bids/",
                 json={"artwork_id": artwork_id, "amount": amount},
                 headers={"Authorization": f"Bearer {buyer_tokens[buyer_index]}"},
@@ -191,30 +165,41 @@ class TestMultipleUsersCompetingFlow:
             assert bid_response.status_code == 200
 
         # Verify current highest bid
-        artwork_check = client.get(f"/api/artworks/{artwork_id}")
-        assert artwork_check.json()["current_highest_bid"] == 800.0
-        assert artwork_check.json()["status"] == "ACTIVE"  # Still below threshold
+        artwork_check = await aclient.get(f"/api/artworks/{artwork_id}")
+        artwork_check_data = artwork_check.json()
+        assert artwork_check_data["current_highest_bid"] == 800.0
+        assert artwork_check_data["status"] == "ACTIVE"  # Still below threshold
 
         # Step 4: Buyer 3 places winning bid
-        winning_response = client.post(
+        winning_response = await aclient.post(
             "/api/bids/",
             json={"artwork_id": artwork_id, "amount": 1000.0},
             headers={"Authorization": f"Bearer {buyer_tokens[2]}"},
         )
         assert winning_response.status_code == 200
-        assert winning_response.json()["is_winning"] is True
+        winning_data = winning_response.json()
+        assert winning_data["is_winning"] is True
 
         # Verify artwork pending payment
-        final_artwork = client.get(f"/api/artworks/{artwork_id}")
-        assert final_artwork.json()["status"] == "PENDING_PAYMENT"
+        assert winning_data["artwork_status"] == "PENDING_PAYMENT"
 
-        # Verify Buyer 1 and Buyer 2 cannot bid anymore
-        late_bid = client.post(
-            "/api/bids/",
-            json={"artwork_id": artwork_id, "amount": 1500.0},
-            headers={"Authorization": f"Bearer {buyer_tokens[0]}"},
+        # Verify Buyer 1 and Buyer 2 cannot bid anymore, alongside the final artwork state
+        late_bid_1, late_bid_2, final_artwork = await asyncio.gather(
+            aclient.post(
+                "/api/bids/",
+                json={"artwork_id": artwork_id, "amount": 1500.0},
+                headers={"Authorization": f"Bearer {buyer_tokens[0]}"},
+            ),
+            aclient.post(
+                "/api/bids/",
+                json={"artwork_id": artwork_id, "amount": 1500.0},
+                headers={"Authorization": f"Bearer {buyer_tokens[1]}"},
+            ),
+            aclient.get(f"/api/artworks/{artwork_id}"),
         )
-        assert late_bid.status_code == 400
+        assert late_bid_1.status_code == 400
+        assert late_bid_2.status_code == 400
+        assert final_artwork.json()["current_highest_bid"] == 1000.0
 
 
 class TestSellerMultipleArtworksFlow:
@@ -227,32 +212,11 @@ class TestSellerMultipleArtworksFlow:
         2. Some get sold, some remain active
         3. Verify seller's artworks
         """
-        from models.user import User
-        from services.jwt_service import JWTService
-
         # Create seller in database
-        seller = User(auth0_sub="auth0|multi_seller")
-        db_session.add(seller)
-        db_session.commit()
-        db_session.refresh(seller)
-
-        # Create seller token
-        seller_token = JWTService.create_access_token(
-            data={"sub": "auth0|multi_seller", "role": "SELLER"},
-            expires_delta=timedelta(hours=1),
-        )
+        seller, seller_token = create_user_with_token(db_session, "auth0|multi_seller", SELLER)
 
         # Create buyer in database
-        buyer = User(auth0_sub="auth0|multi_buyer")
-        db_session.add(buyer)
-        db_session.commit()
-        db_session.refresh(buyer)
-
-        # Create buyer token
-        buyer_token = JWTService.create_access_token(
-            data={"sub": "auth0|multi_buyer", "role": "BUYER"},
-            expires_delta=timedelta(hours=1),
-        )
+        buyer, buyer_token = create_user_with_token(db_session, "auth0|multi_buyer", BUYER)
 
         # Create 3 artworks
         artworks = []
@@ -282,14 +246,12 @@ class TestSellerMultipleArtworksFlow:
         # Don't bid on third
 
         # Verify artwork statuses
-        artwork1 = client.get(f"/api/artworks/{artworks[0]['id']}")
-        assert artwork1.json()["status"] == "PENDING_PAYMENT"
-
-        artwork2 = client.get(f"/api/artworks/{artworks[1]['id']}")
-        assert artwork2.json()["status"] == "ACTIVE"
-
-        artwork3 = client.get(f"/api/artworks/{artworks[2]['id']}")
-        assert artwork3.json()["status"] == "ACTIVE"
+        all_artworks = client.get("/api/artworks")
+        assert all_artworks.status_code == 200
+        statuses = {a["id"]: a["status"] for a in all_artworks.json()}
+        assert statuses[artworks[0]["id"]] == "PENDING_PAYMENT"
+        assert statuses[artworks[1]["id"]] == "ACTIVE"
+        assert statuses[artworks[2]["id"]] == "ACTIVE"
 
 
 class TestErrorRecoveryFlow:
@@ -302,31 +264,10 @@ class TestErrorRecoveryFlow:
         2. User corrects and places valid bid
         3. Bid succeeds
         """
-        from models.user import User
-        from services.jwt_service import JWTService
-
         # Setup: Create users in database
-        seller = User(auth0_sub="auth0|error_seller")
-        db_session.add(seller)
-        db_session.commit()
-        db_session.refresh(seller)
+        seller, seller_token = create_user_with_token(db_session, "auth0|error_seller", SELLER)
 
-        # Create seller token
-        seller_token = JWTService.create_access_token(
-            data={"sub": "auth0|error_seller", "role": "SELLER"},
-            expires_delta=timedelta(hours=1),
-        )
-
-        buyer = User(auth0_sub="auth0|error_buyer")
-        db_session.add(buyer)
-        db_session.commit()
-        db_session.refresh(buyer)
-
-        # Create buyer token
-        buyer_token = JWTService.create_access_token(
-            data={"sub": "auth0|error_buyer", "role": "BUYER"},
-            expires_delta=timedelta(hours=1),
-        )
+        buyer, buyer_token = create_user_with_token(db_session, "auth0|error_buyer", BUYER)
 
         artwork_payload = {"title": "Error Test Art", "secret_threshold": 100.0}
         artwork_response = client.post(
@@ -363,8 +304,6 @@ class TestErrorRecoveryFlow:
         2. User tries to register again (should fail)
         3. User can still use original account
         """
-        from models.user import User
-
         # First registration - create user in database
         user = User(auth0_sub="auth0|duplicate")
         db_session.add(user)
@@ -389,6 +328,7 @@ class TestErrorRecoveryFlow:
 class TestCompleteMarketplaceFlow:
     """Test comprehensive marketplace scenario."""
 
+    @pytest.mark.slow
     def test_complete_marketplace_scenario(self, client, db_session):
         """
         Complete marketplace flow:
@@ -397,40 +337,19 @@ class TestCompleteMarketplaceFlow:
         3. Some artworks sold, some remain
         4. Verify marketplace state
         """
-        from models.user import User
-        from services.jwt_service import JWTService
-
         # Setup: Create 2 sellers, 3 buyers
         sellers = []
         seller_tokens = []
         for i in range(1, 3):
-            seller = User(auth0_sub=f"auth0|market_seller{i}")
-            db_session.add(seller)
-            db_session.commit()
-            db_session.refresh(seller)
+            seller, token = create_user_with_token(db_session, f"auth0|market_seller{i}", SELLER)
             sellers.append(seller.id)
-
-            # Create seller token
-            token = JWTService.create_access_token(
-                data={"sub": f"auth0|market_seller{i}", "role": "SELLER"},
-                expires_delta=timedelta(hours=1),
-            )
             seller_tokens.append(token)
 
         buyers = []
         buyer_tokens = []
         for i in range(1, 4):
-            buyer = User(auth0_sub=f"auth0|market_buyer{i}")
-            db_session.add(buyer)
-            db_session.commit()
-            db_session.refresh(buyer)
+            buyer, token = create_user_with_token(db_session, f"auth0|market_buyer{i}", BUYER)
             buyers.append(buyer.id)
-
-            # Create buyer token
-            token = JWTService.create_access_token(
-                data={"sub": f"auth0|market_buyer{i}", "role": "BUYER"},
-                expires_delta=timedelta(hours=1),
-            )
             buyer_tokens.append(token)
 
         # Each seller creates 2 artworks
@@ -482,11 +401,10 @@ class TestCompleteMarketplaceFlow:
         assert len(artwork_list) == 4
 
         # Count pending payment vs active
-        pending_payment_count = sum(1 for a in artwork_list if a["status"] == "PENDING_PAYMENT")
-        active_count = sum(1 for a in artwork_list if a["status"] == "ACTIVE")
+        statuses = Counter(a["status"] for a in artwork_list)
 
-        assert pending_payment_count >= 1  # At least artwork 1 is pending payment
-        assert active_count >= 2  # At least 2 remain active
+        assert statuses["PENDING_PAYMENT"] >= 1  # At least artwork 1 is pending payment
+        assert statuses["ACTIVE"] >= 2  # At least 2 remain active
 
         # Verify all users exist
         all_users = client.get("/api/users")
@@ -500,31 +418,10 @@ class TestEdgeCaseFlows:
         """
         Flow: Buyer immediately purchases by bidding at threshold.
         """
-        from models.user import User
-        from services.jwt_service import JWTService
-
         # Setup - create users in database
-        seller = User(auth0_sub="auth0|instant_seller")
-        db_session.add(seller)
-        db_session.commit()
-        db_session.refresh(seller)
+        seller, seller_token = create_user_with_token(db_session, "auth0|instant_seller", SELLER)
 
-        # Create seller token
-        seller_token = JWTService.create_access_token(
-            data={"sub": "auth0|instant_seller", "role": "SELLER"},
-            expires_delta=timedelta(hours=1),
-        )
-
-        buyer = User(auth0_sub="auth0|instant_buyer")
-        db_session.add(buyer)
-        db_session.commit()
-        db_session.refresh(buyer)
-
-        # Create buyer token
-        buyer_token = JWTService.create_access_token(
-            data={"sub": "auth0|instant_buyer", "role": "BUYER"},
-            expires_delta=timedelta(hours=1),
-        )
+        buyer, buyer_token = create_user_with_token(db_session, "auth0|instant_buyer", BUYER)
 
         artwork = client.post(
             "/api/artworks/",
@@ -540,43 +437,22 @@ class TestEdgeCaseFlows:
         )
 
         assert bid.status_code == 200
-        assert bid.json()["is_winning"] is True
+        bid_data = bid.json()
+        assert bid_data["is_winning"] is True
 
         # Verify pending payment immediately
-        final_artwork = client.get(f"/api/artworks/{artwork['id']}")
-        assert final_artwork.json()["status"] == "PENDING_PAYMENT"
-        assert final_artwork.json()["current_highest_bid"] == 250.0
+        assert bid_data["artwork_status"] == "PENDING_PAYMENT"
+        assert bid_data["current_highest_bid"] == 250.0
 
     def test_zero_threshold_artwork(self, client, db_session):
         """
         Flow: Artwork with threshold of 0 (free or any bid wins).
         """
-        from models.user import User
-        from services.jwt_service import JWTService
-
         # Create seller in database
-        seller = User(auth0_sub="auth0|free_seller")
-        db_session.add(seller)
-        db_session.commit()
-        db_session.refresh(seller)
-
-        # Create seller token
-        seller_token = JWTService.create_access_token(
-            data={"sub": "auth0|free_seller", "role": "SELLER"},
-            expires_delta=timedelta(hours=1),
-        )
+        seller, seller_token = create_user_with_token(db_session, "auth0|free_seller", SELLER)
 
         # Create buyer in database
-        buyer = User(auth0_sub="auth0|free_buyer")
-        db_session.add(buyer)
-        db_session.commit()
-        db_session.refresh(buyer)
-
-        # Create buyer token
-        buyer_token = JWTService.create_access_token(
-            data={"sub": "auth0|free_buyer", "role": "BUYER"},
-            expires_delta=timedelta(hours=1),
-        )
+        buyer, buyer_token = create_user_with_token(db_session, "auth0|free_buyer", BUYER)
 
         # Create free artwork
         artwork = client.post(
@@ -585,23 +461,23 @@ class TestEdgeCaseFlows:
             headers={"Authorization": f"Bearer {seller_token}"},
         )
 
-        if artwork.status_code == 200:
-            artwork_id = artwork.json()["id"]
+        assert artwork.status_code == 200
+        artwork_id = artwork.json()["id"]
 
-            # Any bid should win
-            bid = client.post(
-                "/api/bids/",
-                json={"artwork_id": artwork_id, "amount": 0.01},
-                headers={"Authorization": f"Bearer {buyer_token}"},
-            )
-
-            if bid.status_code == 200:
-                assert bid.json()["is_winning"] is True
+        # Any bid should win
+        bid = client.post(
+            "/api/bids/",
+            json={"artwork_id": artwork_id, "amount": 0.01},
+            headers={"Authorization": f"Bearer {buyer_token}"},
+        )
+        assert bid.status_code == 200
+        assert bid.json()["is_winning"] is True
 
 
 class TestAdminOversightFlow:
     """Test admin monitoring and oversight of platform activity."""
 
+    @pytest.mark.slow
     def test_complete_auction_with_admin_oversight(
         self,
         client,
@@ -666,7 +542,7 @@ class TestAdminOversightFlow:
         transactions = response_data["transactions"]
         assert len(transactions) > 0
         # Verify our transaction is in the list (check artwork_title field)
-        assert any(t.get("artwork_title") == "Admin Oversight Test" for t in transactions)
+        assert "Admin Oversight Test" in {t.get("artwork_title") for t in transactions}
 
         # Step 5: Admin views audit logs
         audit_logs_response = client.get(
@@ -679,7 +555,7 @@ class TestAdminOversightFlow:
         logs = logs_data["logs"]
         assert len(logs) > 0
         # Verify bid-related audit logs exist
-        assert any(log.get("action") in ["bid_placed", "artwork_sold"] for log in logs)
+        assert {log.get("action") for log in logs} & {"bid_placed", "artwork_sold"}
 
         # Step 6: Admin views platform stats
         stats_response = client.get(
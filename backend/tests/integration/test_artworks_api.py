@@ -3,19 +3,52 @@ Integration tests for artworks API endpoints.
 Tests /api/artworks routes with authentication and database.
 """
 
-from unittest.mock import patch
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
 
 import pytest
-
-from models.artwork import ArtworkStatus
-
-
-@pytest.fixture(autouse=True)
-def mock_auth0():
-    """Mock Auth0 verification for all tests in this module to use JWT fallback."""
-    with patch("services.auth_service.AuthService.verify_auth0_token") as mock:
-        mock.side_effect = Exception("Auth0 not available - using JWT")
-        yield mock
+from fastapi import HTTPException
+
+from models.artwork import Artwork, ArtworkStatus
+from models.bid import Bid
+from models.user import User
+from routers.artworks import get_artwork
+
+
+def _json(payload: dict) -> bytes:
+    return json.dumps(payload).encode()
+
+
+# Oversized and invalid request bodies are built and JSON-encoded once at import
+JSON_CONTENT = {"content-type": "application/json"}
+PAST_END_DATE = (datetime.now(UTC) - timedelta(days=1)).isoformat()
+VERY_LONG_TITLE_BODY = _json({"title": "A" * 1000, "secret_threshold": 100.0})
+INVALID_CREATE_BODIES = [
+    pytest.param(
+        _json({"title": "ab", "secret_threshold": 100.0}), "3 characters", id="title_too_short"
+    ),
+    pytest.param(
+        _json({"title": "Valid Title", "description": "a" * 2001, "secret_threshold": 100.0}),
+        "2000",
+        id="description_too_long",
+    ),
+    pytest.param(
+        _json({"title": "Valid Title", "secret_threshold": 100.0, "end_date": PAST_END_DATE}),
+        "future",
+        id="end_date_in_past",
+    ),
+]
+INVALID_UPDATE_BODIES = [
+    pytest.param(_json({"title": "ab"}), "3 characters", id="title_too_short"),
+    pytest.param(_json({"title": "a" * 201}), "200", id="title_too_long"),
+    pytest.param(_json({"description": "a" * 2001}), "2000", id="description_too_long"),
+    pytest.param(_json({"end_date": PAST_END_DATE}), "future", id="end_date_in_past"),
+    pytest.param(_json({"secret_threshold": -100.0}), "non-negative", id="negative_threshold"),
+]
+
+
+pytestmark = pytest.mark.usefixtures("auth0_unavailable")
 
 
 class TestListArtworks:
@@ -41,20 +74,9 @@ class TestListArtworks:
         assert data[0]["title"] == artwork.title
         assert data[0]["seller_id"] == artwork.seller_id
 
-    def test_list_artworks_multiple(self, client, db_session, seller_user):
+    def test_list_artworks_multiple(self, client, make_artworks):
         """Test listing multiple artworks."""
-        from models.artwork import Artwork
-
-        artworks = [
-            Artwork(
-                seller_id=seller_user.id,
-                title=f"Artwork {i}",
-                secret_threshold=100.0 * i,
-            )
-            for i in range(1, 6)
-        ]
-        db_session.add_all(artworks)
-        db_session.commit()
+        make_artworks(5)
 
         response = client.get("/api/artworks")
 
@@ -62,83 +84,49 @@ class TestListArtworks:
         data = response.json()
         assert len(data) == 5
         titles = [a["title"] for a in data]
-        assert "Artwork 1" in titles
-        assert "Artwork 5" in titles
-
-    def test_list_artworks_pagination_default(self, client, db_session, seller_user):
-        """Test default pagination limits."""
-        from models.artwork import Artwork
-
-        # Create 15 artworks
-        artworks = [
-            Artwork(seller_id=seller_user.id, title=f"Art {i}", secret_threshold=100.0)
-            for i in range(15)
-        ]
-        db_session.add_all(artworks)
-        db_session.commit()
-
-        response = client.get("/api/artworks")
-
-        assert response.status_code == 200
-        data = response.json()
-        # Default limit is usually 10 or all
-        assert len(data) <= 15
-
-    def test_list_artworks_pagination_skip(self, client, db_session, seller_user):
-        """Test pagination with skip parameter."""
-        from models.artwork import Artwork
-
-        artworks = [
-            Artwork(seller_id=seller_user.id, title=f"Art {i}", secret_threshold=100.0)
-            for i in range(10)
-        ]
-        db_session.add_all(artworks)
-        db_session.commit()
-
-        response = client.get("/api/artworks?skip=5")
+        assert "Art 1" in titles
+        assert "Art 5" in titles
+
+    @pytest.mark.parametrize(
+        "query, expected_titles",
+        [
+            ("", [f"Art {i}" for i in range(1, 21)]),  # default limit is 20
+            ("?skip=5", [f"Art {i}" for i in range(6, 26)]),
+            ("?limit=3", ["Art 1", "Art 2", "Art 3"]),
+            ("?skip=5&limit=5", [f"Art {i}" for i in range(6, 11)]),
+        ],
+    )
+    def test_list_artworks_pagination(self, client, make_artworks, query, expected_titles):
+        """Test pagination with default, skip and limit parameters."""
+        make_artworks(25)
+
+        response = client.get(f"/api/artworks{query}")
 
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 5
+        assert [a["title"] for a in response.json()] == expected_titles
 
-    def test_list_artworks_pagination_limit(self, client, db_session, seller_user):
-        """Test pagination with limit parameter."""
-        from models.artwork import Artwork
+    def test_list_artworks_keyset_pagination(self, client, make_artworks):
+        """Test paging through artworks with after_id."""
+        make_artworks(12)
 
-        artworks = [
-            Artwork(seller_id=seller_user.id, title=f"Art {i}", secret_threshold=100.0)
-            for i in range(10)
-        ]
-        db_session.add_all(artworks)
-        db_session.commit()
+        first_page = client.get("/api/artworks?limit=5").json()
+        second_page = client.get(f"/api/artworks?limit=5&after_id={first_page[-1]['id']}").json()
+        last_page = client.get(f"/api/artworks?limit=5&after_id={second_page[-1]['id']}").json()
 
-        response = client.get("/api/artworks?limit=3")
+        assert [a["title"] for a in second_page] == [f"Art {i}" for i in range(6, 11)]
+        assert [a["title"] for a in last_page] == ["Art 11", "Art 12"]
 
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 3
-
-    def test_list_artworks_pagination_skip_and_limit(self, client, db_session, seller_user):
-        """Test pagination with both skip and limit."""
-        from models.artwork import Artwork
-
-        artworks = [
-            Artwork(seller_id=seller_user.id, title=f"Art {i}", secret_threshold=100.0)
-            for i in range(20)
-        ]
-        db_session.add_all(artworks)
-        db_session.commit()
+    def test_list_artworks_keyset_pagination_with_status(self, client, make_artworks, artwork):
+        """Test after_id combines with the status filter."""
+        make_artworks(3)
 
-        response = client.get("/api/artworks?skip=5&limit=5")
+        response = client.get(f"/api/artworks?status=ACTIVE&after_id={artwork.id}")
 
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 5
+        assert [a["title"] for a in response.json()] == ["Art 1", "Art 2", "Art 3"]
 
     def test_list_artworks_includes_all_statuses(self, client, db_session, seller_user):
         """Test listing includes artworks with different statuses."""
-        from models.artwork import Artwork
-
         active = Artwork(
             seller_id=seller_user.id,
             title="Active",
@@ -159,7 +147,7 @@ class TestListArtworks:
         )
 
         db_session.add_all([active, sold, archived])
-        db_session.commit()
+        db_session.flush()
 
         response = client.get("/api/artworks")
 
@@ -195,12 +183,15 @@ class TestGetSingleArtwork:
         assert data["seller_id"] == artwork.seller_id
         assert data["status"] == artwork.status.value
 
-    def test_get_artwork_not_found(self, client):
+    @pytest.mark.asyncio
+    async def test_get_artwork_not_found(self, db_session):
         """Test retrieving non-existent artwork returns 404."""
-        response = client.get("/api/artworks/99999")
+        # Pure validation check, so call the route directly
+        with pytest.raises(HTTPException) as exc_info:
+            await get_artwork(artwork_id=99999, db=db_session)
 
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
+        assert exc_info.value.status_code == 404
+        assert "not found" in exc_info.value.detail.lower()
 
     def test_get_artwork_does_not_expose_secret_threshold(self, client, artwork):
         """Test that secret_threshold is not exposed to non-sellers."""
@@ -214,16 +205,10 @@ class TestGetSingleArtwork:
         self, client, db_session, artwork, buyer_user
     ):
         """Test artwork response includes current_highest_bid."""
-        from models.bid import Bid
-
-        # Place some bids
-        bid = Bid(artwork_id=artwork.id, bidder_id=buyer_user.id, amount=150.0)
-        db_session.add(bid)
-        db_session.commit()
-
-        # Update artwork's current_highest_bid
+        # Place a bid and update artwork's current_highest_bid in one flush
+        db_session.add(Bid(artwork_id=artwork.id, bidder_id=buyer_user.id, amount=150.0))
         artwork.current_highest_bid = 150.0
-        db_session.commit()
+        db_session.flush()
 
         response = client.get(f"/api/artworks/{artwork.id}")
 
@@ -261,6 +246,7 @@ class TestCreateArtwork:
             assert data["status"] == "ACTIVE"
             assert data["current_highest_bid"] == 0.0
 
+    @pytest.mark.slow
     def test_create_artwork_without_description(self, client, seller_user):
         """Test creating artwork without optional description."""
         payload = {"title": "Minimal Art", "secret_threshold": 200.0}
@@ -272,16 +258,16 @@ class TestCreateArtwork:
             assert data["title"] == "Minimal Art"
             assert data["description"] is None
 
-    def test_create_artwork_missing_required_fields(self, client, seller_user, seller_token):
+    @pytest.mark.parametrize(
+        "payload",
+        [{"secret_threshold": 100.0}, {"title": "Test"}],
+        ids=["missing_title", "missing_secret_threshold"],
+    )
+    def test_create_artwork_missing_required_fields(self, client, seller_token, payload):
         """Test creating artwork with missing required fields."""
         headers = {"Authorization": f"Bearer {seller_token}"}
 
-        # Missing title
-        response = client.post("/api/artworks/", json={"secret_threshold": 100.0}, headers=headers)
-        assert response.status_code == 422
-
-        # Missing secret_threshold
-        response = client.post("/api/artworks/", json={"title": "Test"}, headers=headers)
+        response = client.post("/api/artworks/", json=payload, headers=headers)
         assert response.status_code == 422
 
     def test_create_artwork_invalid_seller(self, client):
@@ -304,6 +290,7 @@ class TestCreateArtwork:
         # Adjust based on actual requirements
         assert response.status_code in [200, 400, 422]
 
+    @pytest.mark.slow
     def test_create_artwork_zero_threshold(self, client, seller_user):
         """Test creating artwork with zero threshold."""
         payload = {"title": "Free Art", "secret_threshold": 0.0}
@@ -318,6 +305,7 @@ class TestCreateArtwork:
 class TestUploadArtworkImage:
     """Test POST /api/artworks/{artwork_id}/upload-image endpoint."""
 
+    @pytest.mark.slow
     def test_upload_image_endpoint_exists(self, client, artwork, seller_token):
         """Test that image upload endpoint exists (stub implementation)."""
         headers = {"Authorization": f"Bearer {seller_token}"}
@@ -331,6 +319,7 @@ class TestUploadArtworkImage:
         # Endpoint exists but may not be fully implemented
         assert response.status_code in [200, 501, 422]
 
+    @pytest.mark.slow
     def test_upload_image_artwork_not_found(self, client, seller_token):
         """Test uploading image to non-existent artwork."""
         headers = {"Authorization": f"Bearer {seller_token}"}
@@ -347,9 +336,7 @@ class TestArtworkFiltering:
     """Test artwork filtering and search capabilities."""
 
     def test_filter_by_status_active(self, client, db_session, seller_user):
-        """Test filtering artworks by status (if implemented)."""
-        from models.artwork import Artwork
-
+        """Test filtering artworks by status."""
         active = Artwork(
             seller_id=seller_user.id,
             title="Active",
@@ -364,29 +351,26 @@ class TestArtworkFiltering:
         )
 
         db_session.add_all([active, sold])
-        db_session.commit()
+        db_session.flush()
 
-        # If filtering is implemented
         response = client.get("/api/artworks?status=ACTIVE")
 
         assert response.status_code == 200
         data = response.json()
+        assert [a["title"] for a in data] == ["Active"]
 
-        # May or may not be implemented
-        if any("status" in item for item in data):
-            active_items = [a for a in data if a.get("status") == "ACTIVE"]
-            assert len(active_items) >= 1
+    def test_filter_by_invalid_status(self, client):
+        """Test that an unknown status filter is rejected."""
+        response = client.get("/api/artworks?status=UNKNOWN")
+
+        assert response.status_code == 422
 
     def test_filter_by_seller(self, client, db_session, seller_user):
         """Test filtering artworks by seller (if implemented)."""
-        from models.artwork import Artwork
-        from models.user import User
-
         # Create another seller
         another_seller = User(auth0_sub="auth0|seller2")
         db_session.add(another_seller)
-        db_session.commit()
-        db_session.refresh(another_seller)
+        db_session.flush()
         # Attach Auth0 data (simulated)
         another_seller.email = "seller2@test.com"
         another_seller.name = "Seller 2"
@@ -396,7 +380,7 @@ class TestArtworkFiltering:
         artwork2 = Artwork(seller_id=another_seller.id, title="Art 2", secret_threshold=100.0)
 
         db_session.add_all([artwork1, artwork2])
-        db_session.commit()
+        db_session.flush()
 
         # If filtering by seller is implemented
         response = client.get(f"/api/artworks?seller_id={seller_user.id}")
@@ -421,18 +405,18 @@ class TestArtworkEdgeCases:
         data = response.json()
         assert data["current_highest_bid"] == 0.0
 
+    @pytest.mark.slow
     def test_artwork_with_very_long_title(self, client, seller_user, seller_token):
         """Test creating artwork with very long title."""
-        long_title = "A" * 1000
-        payload = {"title": long_title, "secret_threshold": 100.0}
-        headers = {"Authorization": f"Bearer {seller_token}"}
+        headers = {"Authorization": f"Bearer {seller_token}", **JSON_CONTENT}
 
-        response = client.post("/api/artworks/", json=payload, headers=headers)
+        response = client.post("/api/artworks/", content=VERY_LONG_TITLE_BODY, headers=headers)
 
         # Should succeed or fail with validation
         # (400 for too long, 422 for schema validation)
         assert response.status_code in [200, 400, 422]
 
+    @pytest.mark.slow
     def test_artwork_with_unicode_characters(self, client, seller_user):
         """Test creating artwork with unicode in title/description."""
         payload = {
@@ -448,6 +432,7 @@ class TestArtworkEdgeCases:
             assert "艺术品" in data["title"]
             assert "🎨" in data["title"]
 
+    @pytest.mark.slow
     def test_artwork_with_html_in_description(self, client, seller_user):
         """Test creating artwork with HTML in description."""
         payload = {
@@ -463,18 +448,26 @@ class TestArtworkEdgeCases:
             # Should store as-is (sanitization happens on frontend)
             assert "<script>" in data["description"]
 
-    def test_concurrent_artwork_creation(self, client, seller_user, seller_token):
+    @pytest.mark.asyncio
+    async def test_concurrent_artwork_creation(self, aclient, seller_user, seller_token):
         """Test handling concurrent artwork creation."""
         payload1 = {"title": "Concurrent Art 1", "secret_threshold": 100.0}
         payload2 = {"title": "Concurrent Art 2", "secret_threshold": 200.0}
         headers = {"Authorization": f"Bearer {seller_token}"}
 
-        response1 = client.post("/api/artworks/", json=payload1, headers=headers)
-        response2 = client.post("/api/artworks/", json=payload2, headers=headers)
+        response1, response2 = await asyncio.gather(
+            aclient.post("/api/artworks/", json=payload1, headers=headers),
+            aclient.post("/api/artworks/", json=payload2, headers=headers),
+        )
 
         # Both should succeed
         assert response1.status_code in [200, 201]
         assert response2.status_code in [200, 201]
+        assert response1.json()["id"] != response2.json()["id"]
+        assert {response1.json()["title"], response2.json()["title"]} == {
+            "Concurrent Art 1",
+            "Concurrent Art 2",
+        }
 
 
 class TestPaginationValidation:
@@ -502,47 +495,29 @@ class TestPaginationValidation:
 class TestArtworkValidation:
     """Test artwork field validation."""
 
-    def test_create_artwork_title_too_short(self, client, seller_token):
-        """Test that title shorter than 3 characters is rejected."""
-        headers = {"Authorization": f"Bearer {seller_token}"}
-        payload = {"title": "ab", "secret_threshold": 100.0}
-
-        response = client.post("/api/artworks/", json=payload, headers=headers)
-        assert response.status_code == 400
-        assert "3 characters" in response.json()["detail"]
-
-    def test_create_artwork_description_too_long(self, client, seller_token):
-        """Test that description longer than 2000 characters is rejected."""
-        headers = {"Authorization": f"Bearer {seller_token}"}
-        payload = {
-            "title": "Valid Title",
-            "description": "a" * 2001,
-            "secret_threshold": 100.0,
-        }
+    @pytest.mark.parametrize("body, detail", INVALID_CREATE_BODIES)
+    def test_create_artwork_rejects_invalid_fields(self, client, seller_token, body, detail):
+        """Test that invalid title, description and end_date are rejected on create."""
+        headers = {"Authorization": f"Bearer {seller_token}", **JSON_CONTENT}
 
-        response = client.post("/api/artworks/", json=payload, headers=headers)
+        response = client.post("/api/artworks/", content=body, headers=headers)
         assert response.status_code == 400
-        assert "2000" in response.json()["detail"]
+        assert detail in response.json()["detail"].lower()
 
-    def test_create_artwork_end_date_in_past(self, client, seller_token):
-        """Test that end_date in the past is rejected."""
-        from datetime import UTC, datetime, timedelta
 
-        headers = {"Authorization": f"Bearer {seller_token}"}
-        past_date = (datetime.now(UTC) - timedelta(days=1)).isoformat()
-        payload = {
-            "title": "Valid Title",
-            "secret_threshold": 100.0,
-            "end_date": past_date,
-        }
+class TestUpdateArtwork:
+    """Test PUT /api/artworks/{artwork_id} endpoint."""
 
-        response = client.post("/api/artworks/", json=payload, headers=headers)
-        assert response.status_code == 400
-        assert "future" in response.json()["detail"].lower()
+    @pytest.fixture
+    def put_artwork(self, client, artwork, seller_token):
+        """PUT to the test artwork as its owner; pass json= or content= through."""
+        url = f"/api/artworks/{artwork.id}"
+        headers = {"Authorization": f"Bearer {seller_token}", **JSON_CONTENT}
 
+        def _put(**kwargs):
+            return client.put(url, headers=headers, **kwargs)
 
-class TestUpdateArtwork:
-    """Test PUT /api/artworks/{artwork_id} endpoint."""
+        return _put
 
     def test_update_artwork_not_found(self, client, seller_token):
         """Test updating non-existent artwork."""
@@ -552,7 +527,7 @@ class TestUpdateArtwork:
         response = client.put("/api/artworks/99999", json=payload, headers=headers)
         assert response.status_code == 404
 
-    def test_update_artwork_not_owner(self, client, db_session, artwork, buyer_token):
+    def test_update_artwork_not_owner(self, client, artwork, buyer_token):
         """Test that non-owner cannot update artwork."""
         headers = {"Authorization": f"Bearer {buyer_token}"}
         payload = {"title": "Hacked Title"}
@@ -560,63 +535,19 @@ class TestUpdateArtwork:
         response = client.put(f"/api/artworks/{artwork.id}", json=payload, headers=headers)
         assert response.status_code == 403
 
-    def test_update_artwork_success(self, client, artwork, seller_token):
+    def test_update_artwork_success(self, put_artwork):
         """Test successful artwork update by owner."""
-        headers = {"Authorization": f"Bearer {seller_token}"}
-        payload = {"title": "Updated Title"}
-
-        response = client.put(f"/api/artworks/{artwork.id}", json=payload, headers=headers)
+        response = put_artwork(json={"title": "Updated Title"})
         assert response.status_code == 200
         data = response.json()
         assert data["title"] == "Updated Title"
 
-    def test_update_artwork_title_too_short(self, client, artwork, seller_token):
-        """Test that update rejects title < 3 characters."""
-        headers = {"Authorization": f"Bearer {seller_token}"}
-        payload = {"title": "ab"}
-
-        response = client.put(f"/api/artworks/{artwork.id}", json=payload, headers=headers)
-        assert response.status_code == 400
-        assert "3 characters" in response.json()["detail"]
-
-    def test_update_artwork_title_too_long(self, client, artwork, seller_token):
-        """Test that update rejects title > 200 characters."""
-        headers = {"Authorization": f"Bearer {seller_token}"}
-        payload = {"title": "a" * 201}
-
-        response = client.put(f"/api/artworks/{artwork.id}", json=payload, headers=headers)
-        assert response.status_code == 400
-        assert "200" in response.json()["detail"]
-
-    def test_update_artwork_description_too_long(self, client, artwork, seller_token):
-        """Test that update rejects description > 2000 characters."""
-        headers = {"Authorization": f"Bearer {seller_token}"}
-        payload = {"description": "a" * 2001}
-
-        response = client.put(f"/api/artworks/{artwork.id}", json=payload, headers=headers)
-        assert response.status_code == 400
-        assert "2000" in response.json()["detail"]
-
-    def test_update_artwork_end_date_in_past(self, client, artwork, seller_token):
-        """Test that update rejects end_date in past."""
-        from datetime import UTC, datetime, timedelta
-
-        headers = {"Authorization": f"Bearer {seller_token}"}
-        past_date = (datetime.now(UTC) - timedelta(days=1)).isoformat()
-        payload = {"end_date": past_date}
-
-        response = client.put(f"/api/artworks/{artwork.id}", json=payload, headers=headers)
-        assert response.status_code == 400
-        assert "future" in response.json()["detail"].lower()
-
-    def test_update_artwork_negative_threshold(self, client, artwork, seller_token):
-        """Test that update rejects negative threshold."""
-        headers = {"Authorization": f"Bearer {seller_token}"}
-        payload = {"secret_threshold": -100.0}
-
-        response = client.put(f"/api/artworks/{artwork.id}", json=payload, headers=headers)
+    @pytest.mark.parametrize("body, detail", INVALID_UPDATE_BODIES)
+    def test_update_artwork_rejects_invalid_fields(self, put_artwork, body, detail):
+        """Test that update rejects invalid title, description, end_date and threshold."""
+        response = put_artwork(content=body)
         assert response.status_code == 400
-        assert "non-negative" in response.json()["detail"].lower()
+        assert detail in response.json()["detail"].lower()
 
 
 class TestDeleteArtwork:
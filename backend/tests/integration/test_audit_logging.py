@@ -3,22 +3,19 @@ Integration tests for audit logging.
 Tests that security-critical actions are logged to the audit_logs table.
 """
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from models import Artwork
 from models.audit_log import AuditLog
+from models.user import User
+from services.audit_service import AuditService
 
-
-@pytest.fixture(autouse=True)
-def mock_auth0():
-    """Mock Auth0 verification for all tests in this module to use JWT fallback."""
-    with patch("services.auth_service.AuthService.verify_auth0_token") as mock:
-        mock.side_effect = Exception("Auth0 not available - using JWT")
-        yield mock
+pytestmark = pytest.mark.usefixtures("auth0_unavailable")
 
 
 def test_bid_placement_creates_audit_log(
@@ -37,13 +34,14 @@ def test_bid_placement_creates_audit_log(
     )
     assert response.status_code == 200
 
-    # Check that audit log was created
-    audit_logs = db_session.query(AuditLog).filter(AuditLog.action == "bid_placed").all()
-
-    assert len(audit_logs) > 0, "No audit log created for bid placement"
+    # Check that audit log was created for the bid that was just placed
+    latest_log = (
+        db_session.query(AuditLog)
+        .filter(AuditLog.action == "bid_placed", AuditLog.resource_id == response.json()["id"])
+        .one_or_none()
+    )
 
-    # Verify the most recent audit log
-    latest_log = audit_logs[-1]
+    assert latest_log is not None, "No audit log created for bid placement"
     assert latest_log.action == "bid_placed"
     assert latest_log.resource_type == "bid"
     assert latest_log.user_id == buyer_user.id
@@ -70,12 +68,16 @@ def test_artwork_sold_creates_audit_log(
     assert response.status_code == 200
 
     # Check that audit logs were created (both bid_placed and winning_bid_placed)
-    bid_logs = db_session.query(AuditLog).filter(AuditLog.action == "bid_placed").all()
+    logs = (
+        db_session.query(AuditLog)
+        .filter(AuditLog.action.in_(["bid_placed", "winning_bid_placed"]))
+        .order_by(AuditLog.id)
+        .all()
+    )
+    bid_logs = [log for log in logs if log.action == "bid_placed"]
     assert len(bid_logs) > 0, "No audit log created for bid placement"
 
-    winning_bid_logs = (
-        db_session.query(AuditLog).filter(AuditLog.action == "winning_bid_placed").all()
-    )
+    winning_bid_logs = [log for log in logs if log.action == "winning_bid_placed"]
     assert len(winning_bid_logs) > 0, "No audit log created for winning bid"
 
     # Verify the winning_bid_placed audit log
@@ -111,12 +113,11 @@ def test_audit_log_contains_request_metadata(
     )
     assert response.status_code == 200
 
-    # Get the latest audit log
+    # Get the audit log for the bid that was just placed
     audit_log = (
         db_session.query(AuditLog)
-        .filter(AuditLog.action == "bid_placed")
-        .order_by(AuditLog.timestamp.desc())
-        .first()
+        .filter(AuditLog.action == "bid_placed", AuditLog.resource_id == response.json()["id"])
+        .one_or_none()
     )
 
     assert audit_log is not None
@@ -142,12 +143,11 @@ def test_audit_log_timestamps_are_set(
     )
     assert response.status_code == 200
 
-    # Get the latest audit log
+    # Get the audit log for the bid that was just placed
     audit_log = (
         db_session.query(AuditLog)
-        .filter(AuditLog.action == "bid_placed")
-        .order_by(AuditLog.timestamp.desc())
-        .first()
+        .filter(AuditLog.action == "bid_placed", AuditLog.resource_id == response.json()["id"])
+        .one_or_none()
     )
 
     assert audit_log is not None
@@ -160,8 +160,8 @@ def test_losing_bid_does_not_create_artwork_sold_log(
     """Test that a losing bid does not create an artwork_sold audit log."""
     headers = {"Authorization": f"Bearer {buyer_token}"}
     # Get initial count of artwork_sold logs
-    initial_sold_count = (
-        db_session.query(AuditLog).filter(AuditLog.action == "artwork_sold").count()
+    initial_sold_count = db_session.scalar(
+        select(func.count()).select_from(AuditLog).where(AuditLog.action == "artwork_sold")
     )
 
     # Place a losing bid (below threshold)
@@ -178,26 +178,32 @@ def test_losing_bid_does_not_create_artwork_sold_log(
     assert response.status_code == 200
 
     # Verify artwork is still active
-    artwork = db_session.query(Artwork).filter(Artwork.id == artwork.id).first()
+    db_session.refresh(artwork, attribute_names=["status"])
     assert artwork.status.value == "ACTIVE"
 
+    # Count both actions in one aggregate query instead of loading the rows
+    counts = dict(
+        db_session.execute(
+            select(AuditLog.action, func.count())
+            .where(AuditLog.action.in_(["artwork_sold", "bid_placed"]))
+            .group_by(AuditLog.action)
+        ).all()
+    )
+
     # Check that no new artwork_sold log was created
-    final_sold_count = db_session.query(AuditLog).filter(AuditLog.action == "artwork_sold").count()
+    final_sold_count = counts.get("artwork_sold", 0)
 
     assert (
         final_sold_count == initial_sold_count
     ), "Artwork_sold log should not be created for losing bid"
 
     # But bid_placed log should exist
-    bid_logs = db_session.query(AuditLog).filter(AuditLog.action == "bid_placed").all()
-    assert len(bid_logs) > 0, "Bid_placed log should be created even for losing bid"
+    assert counts.get("bid_placed", 0) > 0, "Bid_placed log should be created even for losing bid"
 
 
 def test_audit_log_queryable_by_user(db_session: Session, buyer_user):
     """Test that audit logs can be queried by user_id."""
     # Create some test audit logs
-    from services.audit_service import AuditService
-
     AuditService.log_action(
         db=db_session,
         action="test_action",
@@ -209,16 +215,14 @@ def test_audit_log_queryable_by_user(db_session: Session, buyer_user):
     )
 
     # Query logs by user
-    user_logs = db_session.query(AuditLog).filter(AuditLog.user_id == buyer_user.id).all()
+    user_log = db_session.query(AuditLog.id).filter(AuditLog.user_id == buyer_user.id).first()
 
-    assert len(user_logs) > 0, "Should be able to query audit logs by user"
+    assert user_log is not None, "Should be able to query audit logs by user"
 
 
 def test_audit_log_queryable_by_action(db_session: Session, buyer_user):
     """Test that audit logs can be queried by action type."""
     # Create some test audit logs
-    from services.audit_service import AuditService
-
     AuditService.log_action(
         db=db_session,
         action="specific_test_action",
@@ -230,18 +234,16 @@ def test_audit_log_queryable_by_action(db_session: Session, buyer_user):
     )
 
     # Query logs by action
-    action_logs = db_session.query(AuditLog).filter(AuditLog.action == "specific_test_action").all()
+    action_log = (
+        db_session.query(AuditLog.id).filter(AuditLog.action == "specific_test_action").first()
+    )
 
-    assert len(action_logs) > 0, "Should be able to query audit logs by action"
+    assert action_log is not None, "Should be able to query audit logs by action"
 
 
 def test_audit_service_handles_database_errors_gracefully(db_session: Session, buyer_user):
     """Test that AuditService returns None when database errors occur
     without crashing."""
-    from unittest.mock import MagicMock
-
-    from services.audit_service import AuditService
-
     # Mock db.add to raise an exception
     original_add = db_session.add
     db_session.add = MagicMock(side_effect=Exception("Database connection error"))
@@ -264,5 +266,40 @@ def test_audit_service_handles_database_errors_gracefully(db_session: Session, b
     assert result is None, "AuditService should return None when database errors occur"
 
     # Verify no audit log was created
-    logs = db_session.query(AuditLog).filter(AuditLog.action == "test_action").all()
-    assert len(logs) == 0, "No audit log should be created when error occurs"
+    log_ids = db_session.scalars(select(AuditLog.id).where(AuditLog.action == "test_action")).all()
+    assert log_ids == [], "No audit log should be created when error occurs"
+
+
+def test_audit_log_without_commit_joins_caller_transaction(db_session: Session, seller_user):
+    """Test that commit=False writes in a SAVEPOINT and a failure keeps the caller's work."""
+    artwork = Artwork(seller_id=seller_user.id, title="Audited Art", secret_threshold=100.0)
+    db_session.add(artwork)
+    db_session.flush()
+
+    # Unknown user_id violates the audit_logs foreign key
+    result = AuditService.log_action(
+        db=db_session,
+        action="savepoint_test_action",
+        resource_type="artwork",
+        resource_id=artwork.id,
+        user=User(id=999999, auth0_sub="auth0|missing"),
+        commit=False,
+    )
+    assert result is None
+
+    logged = AuditService.log_action(
+        db=db_session,
+        action="savepoint_test_action",
+        resource_type="artwork",
+        resource_id=artwork.id,
+        user=seller_user,
+        commit=False,
+    )
+    db_session.commit()
+
+    assert logged is not None
+    assert db_session.get(Artwork, artwork.id) is not None
+    logged_user_ids = db_session.scalars(
+        select(AuditLog.user_id).where(AuditLog.action == "savepoint_test_action")
+    ).all()
+    assert logged_user_ids == [seller_user.id]
@@ -0,0 +1,141 @@
+"""
+Integration tests for the batch API endpoint.
+Tests /api/batch dispatching several API calls in one request.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+from utils.auth import get_current_user
+
+pytestmark = pytest.mark.usefixtures("auth0_unavailable")
+
+
+def test_batch_runs_requests_in_order(client: TestClient, artwork):
+    """Sub-requests are executed in order and their results returned in order."""
+    response = client.post(
+        "/api/batch/",
+        json={
+            "requests": [
+                {"method": "GET", "path": f"/api/artworks/{artwork.id}"},
+                {"method": "GET", "path": "/api/artworks/", "params": {"limit": 1}},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    first, second = response.json()["responses"]
+    assert first["status"] == 200
+    assert first["body"]["id"] == artwork.id
+    assert second["status"] == 200
+    assert len(second["body"]) == 1
+
+
+def test_batch_partial_failure_returns_multi_status(client: TestClient, artwork):
+    """A failing sub-request yields 207 while the others still succeed."""
+    response = client.post(
+        "/api/batch/",
+        json={
+            "requests": [
+                {"method": "GET", "path": f"/api/artworks/{artwork.id}"},
+                {"method": "GET", "path": "/api/artworks/99999"},
+            ]
+        },
+    )
+    assert response.status_code == 207
+    statuses = [r["status"] for r in response.json()["responses"]]
+    assert statuses == [200, 404]
+
+
+def test_batch_unhandled_sub_request_error_is_reported_per_item(client: TestClient, artwork):
+    """An exception in one sub-request becomes its 500, not a failure of the whole batch."""
+
+    def broken_dependency():
+        raise RuntimeError("boom")
+
+    app.dependency_overrides[get_current_user] = broken_dependency
+    response = client.post(
+        "/api/batch/",
+        json={
+            "requests": [
+                {"method": "GET", "path": "/api/bids/my-bids"},
+                {"method": "GET", "path": f"/api/artworks/{artwork.id}"},
+            ]
+        },
+    )
+    assert response.status_code == 207
+    statuses = [r["status"] for r in response.json()["responses"]]
+    assert statuses == [500, 200]
+
+
+def test_batch_forwards_authorization(client: TestClient, buyer_user, buyer_token: str):
+    """Sub-requests are authenticated with the caller's token, and only with it."""
+    payload = {"requests": [{"method": "GET", "path": "/api/bids/my-bids"}]}
+
+    anonymous = client.post("/api/batch/", json=payload)
+    assert anonymous.json()["responses"][0]["status"] == 401
+
+    authenticated = client.post(
+        "/api/batch/", json=payload, headers={"Authorization": f"Bearer {buyer_token}"}
+    )
+    assert authenticated.status_code == 200
+    assert authenticated.json()["responses"][0]["body"] == []
+
+
+def test_batch_rejects_paths_outside_api(client: TestClient):
+    """Only /api/ paths may be batched, and batches cannot be nested."""
+    for path in ["/health/", "/api/batch/"]:
+        response = client.post("/api/batch/", json={"requests": [{"method": "GET", "path": path}]})
+        assert response.status_code == 400
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/./batch/", "/api/x/../batch/", "/api/../health/", "/api/%2e%2e/health/"]
+)
+def test_batch_rejects_dot_segment_bypasses(client: TestClient, path: str):
+    """Paths are checked after dot-segment removal, so they cannot escape the allowlist."""
+    response = client.post("/api/batch/", json={"requests": [{"method": "GET", "path": path}]})
+    assert response.status_code == 400
+
+
+def test_batch_rejects_empty_and_oversized_batches(client: TestClient):
+    """Batches must contain between 1 and MAX_BATCH_SIZE requests."""
+    assert client.post("/api/batch/", json={"requests": []}).status_code == 422
+
+    too_many = [{"method": "GET", "path": "/api/artworks/"}] * 21
+    assert client.post("/api/batch/", json={"requests": too_many}).status_code == 422
+
+
+def test_batched_bids_share_the_callers_rate_limit(client: TestClient, artwork, buyer_token: str):
+    """Batching does not bypass per-client limits: sub-requests use the caller's bucket."""
+    headers = {"Authorization": f"Bearer {buyer_token}"}
+    for amount in range(1, 21):  # Bid creation allows 20/minute
+        response = client.post(
+            "/api/bids/", json={"artwork_id": artwork.id, "amount": float(amount)}, headers=headers
+        )
+        assert response.status_code == 200
+
+    response = client.post(
+        "/api/batch/",
+        json={
+            "requests": [
+                {
+                    "method": "POST",
+                    "path": "/api/bids/",
+                    "json": {"artwork_id": artwork.id, "amount": 21.0},
+                }
+            ]
+        },
+        headers=headers,
+    )
+    assert response.status_code == 207
+    assert response.json()["responses"][0]["status"] == 429
+
+
+def test_batch_endpoint_is_rate_limited(client: TestClient):
+    """The batch endpoint has its own limit, since one batch fans out into many calls."""
+    payload = {"requests": [{"method": "GET", "path": "/api/artworks/"}]}
+    statuses = [client.post("/api/batch/", json=payload).status_code for _ in range(11)]
+
+    assert statuses[:10] == [200] * 10
+    assert statuses[10] == 429
@@ -11,19 +11,12 @@ These tests verify that image upload works correctly:
 
 import os
 from io import BytesIO
-from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
 from PIL import Image as PILImage
 
-
-@pytest.fixture(autouse=True)
-def mock_auth0():
-    """Mock Auth0 verification for all tests in this module to use JWT fallback."""
-    with patch("services.auth_service.AuthService.verify_auth0_token") as mock:
-        mock.side_effect = Exception("Auth0 not available - using JWT")
-        yield mock
+pytestmark = pytest.mark.usefixtures("auth0_unavailable")
 
 
 class TestImageUploadPermissions:
@@ -167,6 +167,16 @@ class TestDatabaseIndexes:
             idx["name"] for idx in bid_indexes
         ], "bidder_id should be indexed"
 
+    def test_audit_log_composite_indexes_exist(self, db_session):
+        """Test that audit_logs has (action, timestamp) and (user_id, timestamp) indexes."""
+        inspector = inspect(db_session.bind)
+        audit_indexes = {
+            idx["name"]: idx["column_names"] for idx in inspector.get_indexes("audit_logs")
+        }
+
+        assert audit_indexes.get("ix_audit_logs_action_timestamp") == ["action", "timestamp"]
+        assert audit_indexes.get("ix_audit_logs_user_id_timestamp") == ["user_id", "timestamp"]
+
 
 class TestForeignKeyRelationships:
     """Test that foreign key relationships work correctly."""
@@ -3,10 +3,11 @@ Integration tests for rate limiting middleware.
 Tests rate limiting behavior on various endpoints.
 """
 
-from unittest.mock import patch
-
+import pytest
 from fastapi.testclient import TestClient
 
+pytestmark = pytest.mark.usefixtures("auth0_unavailable")
+
 
 def test_rate_limiting_on_registration(client: TestClient):
     """Test rate limiting functionality - registration endpoint removed
@@ -23,18 +24,13 @@ def test_rate_limiting_on_registration(client: TestClient):
     assert response.status_code == 200, "Rate limiting middleware should not break public endpoints"
 
 
-@patch("services.auth_service.AuthService.verify_auth0_token")
 def test_rate_limiting_on_bid_creation(
-    mock_verify,
     client: TestClient,
     artwork,
     buyer_user,
     buyer_token,
 ):
     """Test rate limiting on bid creation endpoint (20/minute)."""
-    # Mock Auth0 to fallback to JWT
-    mock_verify.side_effect = Exception("Auth0 not available")
-
     # Create multiple bids rapidly
     successful_bids = 0
     rate_limited = False
@@ -62,17 +58,12 @@ def test_rate_limiting_on_bid_creation(
     assert rate_limited or successful_bids == 20, "Rate limit not enforced"
 
 
-@patch("services.auth_service.AuthService.verify_auth0_token")
 def test_rate_limiting_on_artwork_creation(
-    mock_verify,
     client: TestClient,
     seller_user,
     seller_token,
 ):
     """Test rate limiting on artwork creation endpoint (10/hour)."""
-    # Mock Auth0 to fallback to JWT
-    mock_verify.side_effect = Exception("Auth0 not available")
-
     # Create multiple artworks rapidly
     successful_artworks = 0
     rate_limited = False
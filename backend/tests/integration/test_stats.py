@@ -8,8 +8,6 @@ These tests verify that stats endpoints return correct data:
 - Authorization requirements
 """
 
-from unittest.mock import patch
-
 import pytest
 from fastapi.testclient import TestClient
 
@@ -17,13 +15,7 @@ from models.artwork import Artwork, ArtworkStatus
 from models.bid import Bid
 from models.user import User
 
-
-@pytest.fixture(autouse=True)
-def mock_auth0():
-    """Mock Auth0 verification for all tests in this module to use JWT fallback."""
-    with patch("services.auth_service.AuthService.verify_auth0_token") as mock:
-        mock.side_effect = Exception("Auth0 not available - using JWT")
-        yield mock
+pytestmark = pytest.mark.usefixtures("auth0_unavailable")
 
 
 class TestUserStats:
@@ -206,19 +198,11 @@ class TestSellerStats:
         assert data["total_earnings"] == 0.0
 
     def test_seller_stats_with_active_artworks(
-        self, client: TestClient, seller_token: str, seller_user: User, db_session
+        self, client: TestClient, seller_token: str, make_artworks
     ):
         """Test stats reflecting active artworks."""
         # Create multiple artworks
-        for i in range(3):
-            artwork = Artwork(
-                seller_id=seller_user.id,
-                title=f"Art {i}",
-                secret_threshold=100.0,
-                status=ArtworkStatus.ACTIVE,
-            )
-            db_session.add(artwork)
-        db_session.commit()
+        make_artworks(3)
 
         response = client.get(
             "/api/stats/seller", headers={"Authorization": f"Bearer {seller_token}"}
@@ -3,6 +3,10 @@ Integration tests for users API endpoints.
 Tests /api/users routes with pagination and access control.
 """
 
+from models.artwork import Artwork
+from models.bid import Bid
+from models.user import User
+
 
 class TestListUsers:
     """Test GET /api/users endpoint."""
@@ -41,8 +45,6 @@ class TestListUsers:
 
     def test_list_users_pagination_default(self, client, db_session):
         """Test default pagination."""
-        from models.user import User
-
         # Create 15 users
         users = []
         for i in range(15):
@@ -66,8 +68,6 @@ class TestListUsers:
 
     def test_list_users_pagination_skip(self, client, db_session):
         """Test pagination with skip parameter."""
-        from models.user import User
-
         users = []
         for i in range(10):
             user = User(auth0_sub=f"auth0|skip{i}")
@@ -90,8 +90,6 @@ class TestListUsers:
 
     def test_list_users_pagination_limit(self, client, db_session):
         """Test pagination with limit parameter."""
-        from models.user import User
-
         users = []
         for i in range(10):
             user = User(auth0_sub=f"auth0|limit{i}")
@@ -114,8 +112,6 @@ class TestListUsers:
 
     def test_list_users_pagination_skip_and_limit(self, client, db_session):
         """Test pagination with both skip and limit."""
-        from models.user import User
-
         users = []
         for i in range(20):
             user = User(auth0_sub=f"auth0|both{i}")
@@ -277,8 +273,6 @@ class TestUserRelationships:
 
     def test_get_user_with_artworks(self, client, db_session, seller_user):
         """Test user response may include artworks (if implemented)."""
-        from models.artwork import Artwork
-
         # Create artworks for seller
         artwork = Artwork(seller_id=seller_user.id, title="Seller's Art", secret_threshold=100.0)
         db_session.add(artwork)
@@ -291,8 +285,6 @@ class TestUserRelationships:
 
     def test_get_user_with_bids(self, client, db_session, buyer_user, artwork):
         """Test user response may include bids (if implemented)."""
-        from models.bid import Bid
-
         # Create bid for buyer
         bid = Bid(artwork_id=artwork.id, bidder_id=buyer_user.id, amount=50.0)
         db_session.add(bid)
@@ -348,8 +340,6 @@ class TestUserEdgeCases:
 
     def test_user_with_special_characters_in_name(self, client, db_session):
         """Test user with special characters in name."""
-        from models.user import User
-
         user = User(
             auth0_sub="auth0|special",
         )
@@ -371,8 +361,6 @@ class TestUserEdgeCases:
 
     def test_user_with_very_long_name(self, client, db_session):
         """Test user with very long name."""
-        from models.user import User
-
         long_name = "A" * 500
         user = User(
             auth0_sub="auth0|longname",
@@ -398,9 +386,6 @@ class TestUserStatistics:
 
     def test_get_user_statistics(self, client, db_session, seller_user, buyer_user):
         """Test getting user statistics (total artworks, bids, etc.)."""
-        from models.artwork import Artwork
-        from models.bid import Bid
-
         # Create artworks for seller
         artwork = Artwork(seller_id=seller_user.id, title="Stats Art", secret_threshold=100.0)
         db_session.add(artwork)
@@ -419,8 +404,6 @@ class TestUserStatistics:
 
     def test_get_user_artworks_count(self, client, db_session, seller_user):
         """Test counting user's artworks (if implemented)."""
-        from models.artwork import Artwork
-
         artworks = [
             Artwork(seller_id=seller_user.id, title=f"Art {i}", secret_threshold=100.0)
             for i in range(5)
@@ -435,8 +418,6 @@ class TestUserStatistics:
 
     def test_get_user_bids_count(self, client, db_session, buyer_user, artwork):
         """Test counting user's bids (if implemented)."""
-        from models.bid import Bid
-
         bids = [
             Bid(artwork_id=artwork.id, bidder_id=buyer_user.id, amount=10.0 * i)
             for i in range(1, 6)
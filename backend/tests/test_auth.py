@@ -8,6 +8,9 @@ from fastapi import HTTPException
 from models.user import User
 from utils.auth import get_current_user, require_role
 
+# Auth0 verification fails unless a test patches it, so tokens take the JWT path
+pytestmark = pytest.mark.usefixtures("auth0_unavailable")
+
 
 class TestGetCurrentUser:
     """Test get_current_user authentication function."""
@@ -58,32 +61,17 @@ class TestGetCurrentUser:
         assert result.email == "test@example.com"
 
     @pytest.mark.asyncio
-    @patch("utils.auth.AuthService.verify_auth0_token")
-    @patch("utils.auth.JWTService.verify_token")
-    async def test_get_current_user_auth0_fails_jwt_succeeds(
-        self, mock_jwt_verify, mock_auth0_verify, db_session
-    ):
+    async def test_get_current_user_auth0_fails_jwt_succeeds(self, db_session, token_factory):
         """Test fallback to JWT when Auth0 fails."""
-        # Auth0 fails
-        mock_auth0_verify.side_effect = ValueError("Invalid Auth0 token")
-
         # JWT succeeds
         user = User(auth0_sub="auth0|jwt123")
-        user.email = "jwt@example.com"
-        user.name = "JWT User"
-        user.role = "SELLER"
         db_session.add(user)
         db_session.commit()
 
-        mock_jwt_verify.return_value = {
-            "sub": "auth0|jwt123",
-            "email": "jwt@example.com",
-            "name": "JWT User",
-            "role": "SELLER",
-        }
-
         mock_creds = MagicMock()
-        mock_creds.credentials = "valid_jwt_token"
+        mock_creds.credentials = token_factory(
+            "auth0|jwt123", role="SELLER", email="jwt@example.com", name="JWT User"
+        )
 
         result = await get_current_user(credentials=mock_creds, db=db_session)
 
@@ -92,34 +80,19 @@ class TestGetCurrentUser:
         assert result.role == "SELLER"
 
     @pytest.mark.asyncio
-    @patch("utils.auth.AuthService.verify_auth0_token")
-    @patch("utils.auth.JWTService.verify_token")
-    async def test_get_current_user_jwt_by_user_id(
-        self, mock_jwt_verify, mock_auth0_verify, db_session
-    ):
+    async def test_get_current_user_jwt_by_user_id(self, db_session, token_factory):
         """Test JWT authentication with integer user ID (backward compatibility)."""
-        # Auth0 fails
-        mock_auth0_verify.side_effect = ValueError("Invalid Auth0 token")
-
         # Create user with integer ID
         user = User(auth0_sub="auth0|old123")
-        user.email = "old@example.com"
-        user.name = "Old User"
-        user.role = "BUYER"
         db_session.add(user)
         db_session.commit()
         db_session.refresh(user)
 
-        # JWT returns integer ID
-        mock_jwt_verify.return_value = {
-            "sub": str(user.id),
-            "email": "old@example.com",
-            "name": "Old User",
-            "role": "BUYER",
-        }
-
+        # JWT carries the integer ID as its subject
         mock_creds = MagicMock()
-        mock_creds.credentials = "valid_jwt_token"
+        mock_creds.credentials = token_factory(
+            str(user.id), role="BUYER", email="old@example.com", name="Old User"
+        )
 
         result = await get_current_user(credentials=mock_creds, db=db_session)
 
@@ -127,25 +100,13 @@ class TestGetCurrentUser:
         assert result.email == "old@example.com"
 
     @pytest.mark.asyncio
-    @patch("utils.auth.AuthService.verify_auth0_token")
-    @patch("utils.auth.JWTService.verify_token")
-    async def test_get_current_user_jwt_user_not_found(
-        self, mock_jwt_verify, mock_auth0_verify, db_session
-    ):
+    async def test_get_current_user_jwt_user_not_found(self, db_session, token_factory):
         """Test JWT authentication when user not in database."""
-        # Auth0 fails
-        mock_auth0_verify.side_effect = ValueError("Invalid Auth0 token")
-
         # JWT succeeds but user doesn't exist
-        mock_jwt_verify.return_value = {
-            "sub": "auth0|nonexistent",
-            "email": "none@example.com",
-            "name": "None User",
-            "role": "BUYER",
-        }
-
         mock_creds = MagicMock()
-        mock_creds.credentials = "valid_jwt_token"
+        mock_creds.credentials = token_factory(
+            "auth0|nonexistent", role="BUYER", email="none@example.com", name="None User"
+        )
 
         with pytest.raises(HTTPException) as exc_info:
             await get_current_user(credentials=mock_creds, db=db_session)
@@ -154,18 +115,9 @@ class TestGetCurrentUser:
         assert "Invalid authentication credentials" in exc_info.value.detail
 
     @pytest.mark.asyncio
-    @patch("utils.auth.AuthService.verify_auth0_token")
-    @patch("utils.auth.JWTService.verify_token")
-    async def test_get_current_user_all_methods_fail(
-        self, mock_jwt_verify, mock_auth0_verify, db_session
-    ):
+    async def test_get_current_user_all_methods_fail(self, db_session):
         """Test when both Auth0 and JWT authentication fail."""
-        # Auth0 fails
-        mock_auth0_verify.side_effect = ValueError("Invalid Auth0 token")
-
-        # JWT fails
-        mock_jwt_verify.side_effect = Exception("Invalid JWT")
-
+        # Not a JWT, so signature verification fails too
         mock_creds = MagicMock()
         mock_creds.credentials = "invalid_token"
 
@@ -8,13 +8,15 @@ from unittest.mock import Mock, patch
 
 import jwt
 import pytest
+import requests
 from jwt import DecodeError, ExpiredSignatureError
 
 from config.settings import Settings
+from models.user import User
 
 # UserRole enum removed - now using string literals
 from schemas.auth import AuthUser
-from services.auth_service import AuthService
+from services.auth_service import AuthService, _insert_user_if_missing
 from services.jwt_service import JWTService
 
 
@@ -67,13 +69,37 @@ class TestAuth0Service:
     @patch("services.auth_service.requests.get")
     def test_verify_auth0_token_request_exception(self, mock_get):
         """Test Auth0 token verification with requests.RequestException."""
-        import requests
-
         mock_get.side_effect = requests.RequestException("Connection timeout")
 
         with pytest.raises(ValueError, match="Auth0 verification failed"):
             AuthService.verify_auth0_token("token")
 
+    @patch("services.auth_service.requests.get")
+    def test_verify_auth0_token_skips_network_after_connection_error(self, mock_get):
+        """Test that an unreachable Auth0 is not retried within the outage window."""
+        mock_get.side_effect = requests.ConnectionError("Connection refused")
+
+        with pytest.raises(ValueError, match="Auth0 verification failed"):
+            AuthService.verify_auth0_token("token")
+        with pytest.raises(ValueError, match="Auth0 recently unreachable"):
+            AuthService.verify_auth0_token("token")
+
+        assert mock_get.call_count == 1
+
+    @patch("services.auth_service.requests.get")
+    def test_verify_auth0_token_rejected_token_does_not_open_outage(self, mock_get):
+        """Test that a 401 from Auth0 is not treated as an outage."""
+        mock_response = Mock()
+        mock_response.status_code = 401
+        mock_response.text = "Unauthorized"
+        mock_get.return_value = mock_response
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid Auth0 token"):
+                AuthService.verify_auth0_token("invalid_token")
+
+        assert mock_get.call_count == 2
+
     @patch("services.auth_service.requests.get")
     def test_verify_auth0_token_no_roles(self, mock_get):
         """Test Auth0 token with missing roles claim."""
@@ -92,32 +118,26 @@ class TestAuth0Service:
 
         assert result.roles == []
 
-    def test_map_auth0_role_to_user_role_buyer(self):
-        """Test mapping Auth0 buyer role."""
-        assert AuthService.map_auth0_role_to_user_role(["buyer"]) == "BUYER"
-        assert AuthService.map_auth0_role_to_user_role([]) == "BUYER"  # Default
-
-    def test_map_auth0_role_to_user_role_seller(self):
-        """Test mapping Auth0 seller role."""
-        assert AuthService.map_auth0_role_to_user_role(["seller"]) == "SELLER"
-        assert AuthService.map_auth0_role_to_user_role(["buyer", "seller"]) == "SELLER"
-
-    def test_map_auth0_role_to_user_role_admin(self):
-        """Test mapping Auth0 admin role (highest priority)."""
-        assert AuthService.map_auth0_role_to_user_role(["admin"]) == "ADMIN"
-        assert AuthService.map_auth0_role_to_user_role(["buyer", "seller", "admin"]) == "ADMIN"
-        assert AuthService.map_auth0_role_to_user_role(["admin", "seller"]) == "ADMIN"
-
-    def test_map_auth0_role_to_user_role_case_insensitive(self):
-        """Test role mapping is case-insensitive."""
-        assert AuthService.map_auth0_role_to_user_role(["ADMIN"]) == "ADMIN"
-        assert AuthService.map_auth0_role_to_user_role(["Seller"]) == "SELLER"
-        assert AuthService.map_auth0_role_to_user_role(["BuYeR"]) == "BUYER"
-
-    def test_map_auth0_role_unknown(self):
-        """Test mapping unknown role defaults to BUYER."""
-        assert AuthService.map_auth0_role_to_user_role(["unknown"]) == "BUYER"
-        assert AuthService.map_auth0_role_to_user_role(["moderator", "viewer"]) == "BUYER"
+    @pytest.mark.parametrize(
+        "auth0_roles,expected",
+        [
+            (["buyer"], "BUYER"),
+            ([], "BUYER"),  # Default
+            (["seller"], "SELLER"),
+            (["buyer", "seller"], "SELLER"),
+            (["admin"], "ADMIN"),  # Highest priority
+            (["buyer", "seller", "admin"], "ADMIN"),
+            (["admin", "seller"], "ADMIN"),
+            (["ADMIN"], "ADMIN"),  # Case-insensitive
+            (["Seller"], "SELLER"),
+            (["BuYeR"], "BUYER"),
+            (["unknown"], "BUYER"),  # Unknown roles default to BUYER
+            (["moderator", "viewer"], "BUYER"),
+        ],
+    )
+    def test_map_auth0_role_to_user_role(self, auth0_roles, expected):
+        """Test mapping Auth0 roles to the primary user role."""
+        assert AuthService.map_auth0_role_to_user_role(auth0_roles) == expected
 
     def test_get_user_by_auth0_sub_exists(self, db_session, buyer_user):
         """Test retrieving existing user by auth0_sub."""
@@ -154,6 +174,23 @@ class TestAuth0Service:
         assert db_user is not None
         assert db_user.id == user.id
 
+    def test_insert_user_if_missing_ignores_duplicate_sub(self, db_session):
+        """Test that a racing insert for the same sub is a no-op, not an IntegrityError."""
+        _insert_user_if_missing(db_session, "auth0|race123")
+        _insert_user_if_missing(db_session, "auth0|race123")
+
+        count = db_session.query(User).filter(User.auth0_sub == "auth0|race123").count()
+        assert count == 1
+
+    def test_insert_user_if_missing_without_on_conflict_dialect(self, db_session):
+        """Test that dialects without ON CONFLICT fall back to a SAVEPOINT insert."""
+        with patch.dict("services.auth_service._INSERTS", clear=True):
+            _insert_user_if_missing(db_session, "auth0|fallback123")
+            _insert_user_if_missing(db_session, "auth0|fallback123")
+
+        count = db_session.query(User).filter(User.auth0_sub == "auth0|fallback123").count()
+        assert count == 1
+
     def test_get_or_create_user_existing_user(self, db_session, buyer_user):
         """Test retrieving existing user without modification."""
         auth_user = AuthUser(
@@ -0,0 +1,81 @@
+"""
+Unit tests for the in-process TTL cache used by admin endpoints.
+"""
+
+from sqlalchemy.orm import Session
+
+from services.audit_service import AuditService
+from utils.cache import TTLCache, admin_cache, clear_admin_cache_on_commit
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_or_set_returns_cached_value_within_ttl():
+    """Second lookup inside the TTL window does not recompute."""
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=4, ttl=5, timer=timer)
+    calls = []
+
+    assert cache.get_or_set("k", lambda: calls.append(1) or "a") == "a"
+    timer.now = 4.9
+    assert cache.get_or_set("k", lambda: calls.append(1) or "b") == "a"
+    assert len(calls) == 1
+
+
+def test_get_or_set_recomputes_after_expiry():
+    """Expired entries are recomputed."""
+    timer = FakeTimer()
+    cache = TTLCache(maxsize=4, ttl=5, timer=timer)
+
+    cache.get_or_set("k", lambda: "a")
+    timer.now = 5.0
+    assert cache.get_or_set("k", lambda: "b") == "b"
+
+
+def test_maxsize_evicts_oldest_entry():
+    """Cache never grows beyond maxsize."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    for key in ("a", "b", "c"):
+        cache.get_or_set(key, lambda key=key: key)
+
+    assert len(cache) == 2
+    assert cache.get_or_set("a", lambda: "recomputed") == "recomputed"
+
+
+def test_clear_drops_all_entries():
+    cache = TTLCache(maxsize=4, ttl=60)
+    cache.get_or_set("k", lambda: "a")
+    cache.clear()
+    assert cache.get_or_set("k", lambda: "b") == "b"
+
+
+def test_clear_on_commit_waits_for_outer_commit(db_session: Session):
+    """Releasing a SAVEPOINT keeps the cache; the outer commit clears it."""
+    admin_cache.get_or_set("k", lambda: "a")
+    clear_admin_cache_on_commit(db_session)
+
+    with db_session.begin_nested():
+        pass
+    assert len(admin_cache) == 1
+
+    db_session.commit()
+    assert len(admin_cache) == 0
+
+
+def test_uncommitted_audit_event_keeps_cache_until_caller_commits(db_session: Session):
+    """log_action(commit=False) defers the clear to the caller's commit."""
+    admin_cache.get_or_set("k", lambda: "a")
+
+    AuditService.log_action(
+        db=db_session, action="cache_test", resource_type="artwork", commit=False
+    )
+    assert len(admin_cache) == 1
+
+    db_session.commit()
+    assert len(admin_cache) == 0
@@ -13,7 +13,7 @@ from models.artwork import ArtworkStatus
 # UserRole enum removed - now using string literals
 from schemas.artwork import ArtworkCreate, ArtworkResponse, ArtworkUpdate, ArtworkWithSecretResponse
 from schemas.auth import AuthUser, TokenResponse
-from schemas.bid import BidCreate, BidResponse
+from schemas.bid import BidCreate, BidPlacedResponse, BidResponse
 from schemas.user import UserCreate, UserResponse, UserUpdate
 
 
@@ -219,6 +219,21 @@ class TestBidSchemas:
         assert response.is_winning is True
         assert isinstance(response.created_at, datetime)
 
+    def test_bid_placed_response_includes_artwork_state(self):
+        """Test BidPlacedResponse carries the artwork state after the bid."""
+        response = BidPlacedResponse(
+            id=1,
+            artwork_id=5,
+            bidder_id=10,
+            amount=200.0,
+            created_at=datetime.now(),
+            is_winning=True,
+            artwork_status=ArtworkStatus.PENDING_PAYMENT,
+            current_highest_bid=200.0,
+        )
+        assert response.artwork_status == "PENDING_PAYMENT"
+        assert response.current_highest_bid == 200.0
+
 
 class TestAuthSchemas:
     """Test authentication-related Pydantic schemas."""
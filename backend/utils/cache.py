@@ -0,0 +1,70 @@
+"""
+Small in-process TTL cache for expensive read-only aggregates.
+
+Used by the admin dashboard endpoints, which poll full-table counts.
+Entries expire after ``ttl`` seconds and the whole cache is cleared once
+a transaction that wrote an audit event or artwork change commits, so admins
+never see stale audit logs or counts.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ``ttl`` seconds after insertion."""
+
+    def __init__(self, maxsize: int, ttl: float, timer: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get_or_set(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing and storing it on a miss."""
+        now = self._timer()
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        value = compute()
+        self._data[key] = (now + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+# Shared cache for /api/admin stats, health metrics and audit-log pages
+admin_cache = TTLCache(maxsize=128, ttl=5)
+
+
+_CLEAR_ON_COMMIT = "clear_admin_cache_on_commit"
+
+
+def clear_admin_cache_on_commit(db: Session) -> None:
+    """Clear ``admin_cache`` once ``db``'s outermost transaction commits.
+
+    Clearing before the commit would let a concurrent admin request cache
+    the pre-commit rows for a full TTL.
+    """
+    db.info[_CLEAR_ON_COMMIT] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_admin_cache_after_commit(session: Session) -> None:
+    # Releasing a SAVEPOINT also fires after_commit; wait for the real commit
+    if session.in_nested_transaction():
+        return
+    if session.info.pop(_CLEAR_ON_COMMIT, False):
+        admin_cache.clear()